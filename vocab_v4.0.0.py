@@ -1,13 +1,17 @@
 import csv
+import functools
 import html
+import importlib.util
 import json
 import os
 import random
+import re
 import shutil
 import sqlite3
 import sys
 import time
 import warnings
+from collections import namedtuple
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -19,17 +23,15 @@ warnings.filterwarnings(
 )
 
 # --- stats & viz (optional matplotlib) ---
+# 启动时只探测是否安装；真正 import（连同字体注册）推迟到第一次画图，见 _load_mpl()
 HAS_MPL = False
 try:
-    import matplotlib
-
-    matplotlib.use("Qt5Agg")
-    from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-    import matplotlib.pyplot as plt
-
-    HAS_MPL = True
+    HAS_MPL = importlib.util.find_spec("matplotlib") is not None
 except Exception:
     HAS_MPL = False
+FigureCanvas = None
+Figure = None
+_MPL_READY = False
 
 # --- CJK 字体（多重候选 + 本地字体） ---
 CJK_FONT_CANDIDATES = [
@@ -101,12 +103,30 @@ def _init_mpl_cjk_fonts(extra_font_paths=None):
         pass
 
 
-if HAS_MPL:
+def _load_mpl() -> bool:
+    """
+    首次需要画图时才导入 matplotlib 并注册 CJK 字体；之后直接返回。
+    导入失败则把 HAS_MPL 置为 False，调用方自行降级。
+    """
+    global HAS_MPL, FigureCanvas, Figure, _MPL_READY
+    if _MPL_READY:
+        return True
+    if not HAS_MPL:
+        return False
+    try:
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
+        from matplotlib.figure import Figure as _Figure
+    except Exception:
+        HAS_MPL = False
+        return False
+    FigureCanvas, Figure = FigureCanvasQTAgg, _Figure
     # 把 ZenMaruGothic-Medium.ttf 注入 matplotlib 字体管理器（同级或 ./fonts/）
     _init_mpl_cjk_fonts([
         os.path.join(os.path.dirname(__file__), "ZenMaruGothic-Me啊【】dium.ttf"),
         os.path.join(os.path.dirname(__file__), "fonts", "ZenMaruGothic-Medium.ttf"),
     ])
+    _MPL_READY = True
+    return True
 
 
 DB_PATH = os.path.join(os.path.expanduser("~"), "vocab_trainer_units_v2.db")
@@ -115,6 +135,15 @@ SETTINGS_PATH = os.path.join(os.path.expanduser("~"), "vocab_settings.json")
 
 BACKUP_DIR = os.path.join(os.path.expanduser("~"), "vocab_backups")
 
+# 本地时区：启动时解析一次，写时间戳时不再每次 astimezone() 向系统查询
+# （跨夏令时切换的长会话里偏移不会自动更新，重启即恢复）
+_LOCAL_TZ = datetime.now().astimezone().tzinfo
+
+
+def _now_iso() -> str:
+    """带本地时区偏移的当前时间（ISO8601，精确到秒），用于 created_at / last_review / reviews.ts。"""
+    return datetime.now(_LOCAL_TZ).isoformat(timespec="seconds")
+
 
 def _ensure_dir(p: str):
     try:
@@ -166,6 +195,9 @@ def init_db(path=DB_PATH):
         cur.execute('PRAGMA foreign_keys=ON')
         cur.execute('PRAGMA journal_mode=WAL')
         cur.execute('PRAGMA synchronous=NORMAL')
+        cur.execute('PRAGMA temp_store=MEMORY')  # 排序/分组的临时表放内存
+        cur.execute('PRAGMA mmap_size=268435456')  # 256MB 内存映射读，减少 read() 拷贝
+        cur.execute('PRAGMA cache_size=-20000')  # 页缓存约 20MB（负数单位为 KiB）
     except Exception:
         pass
 
@@ -284,6 +316,29 @@ def init_db(path=DB_PATH):
         except Exception:
             pass
 
+    # --- v1 -> v2：统计“最近新增”按天分组的表达式索引 ---
+    # GROUP BY substr(created_at,1,10) ORDER BY ... DESC LIMIT 60 可直接倒序扫索引，免去临时 B 树
+    if ver < 2:
+        try:
+            ensure_index(cur, 'idx_cards_created_day',
+                         'CREATE INDEX idx_cards_created_day ON cards(substr(created_at,1,10))')
+            cur.execute('UPDATE meta SET schema_version = 2')
+            conn.commit()
+        except Exception:
+            pass
+
+    # --- 每次启动：按单元取词的索引兜底 + 刷新统计信息 ---
+    # idx_cards_unit 只在 v0 -> v1 迁移里创建，旧备份恢复等情况下可能缺失，这里幂等补建。
+    # (unit) 索引自带 rowid(=id)，WHERE unit=? ORDER BY id 与 ORDER BY unit, id 都直接走索引、无需临时排序，
+    # 查询里也不按 language 过滤，因此不再另建 (language, unit, id) 复合索引。
+    try:
+        ensure_index(cur, 'idx_cards_unit', 'CREATE INDEX idx_cards_unit ON cards(unit)')
+        conn.commit()
+        # 迁移时只 ANALYZE 过一次（往往还是空库）；optimize 只在统计信息过期时才重新分析，开销很小
+        cur.execute('PRAGMA optimize')
+    except Exception:
+        pass
+
     return conn
 
 
@@ -409,8 +464,7 @@ def _write_csv_rows(path: str, headers: list[str], rows: list[list[str]]):
 def insert_review(conn, card_id: int, mode: int, quality: int,
                   elapsed_ms: int | None = None,
                   before: dict | None = None, after: dict | None = None):
-    from datetime import datetime
-    now = datetime.now().astimezone().isoformat(timespec="seconds")
+    now = _now_iso()
     bf = before or {}
     af = after or {}
     cur = conn.cursor()
@@ -430,11 +484,24 @@ def insert_review(conn, card_id: int, mode: int, quality: int,
     conn.commit()
 
 
+def insert_reviews(conn, items):
+    """
+    批量写 reviews：items 为 [(card_id, ts, mode, quality, elapsed_ms), ...]。
+    一次 executemany + 一次 commit，代替逐条 insert_review 的逐条提交。
+    """
+    if not items:
+        return
+    conn.executemany(
+        'INSERT INTO reviews (card_id, ts, mode, quality, elapsed_ms) VALUES (?, ?, ?, ?, ?)',
+        items)
+    conn.commit()
+
+
 # --------------------------
 # DB 操作
 # --------------------------
 def add_card(conn, language, unit, term, meaning, jp_kanji=None, jp_kana=None, jp_ruby=None):
-    now = datetime.now().astimezone().isoformat(timespec="seconds")
+    now = _now_iso()
     due = None
     cur = conn.cursor()
     cur.execute('''
@@ -598,9 +665,12 @@ class CardSortProxy(QtCore.QSortFilterProxyModel):
         if not self._query:
             return True
         model = self.sourceModel()
+        q = self._query
+        # CardTableModel 预先拼好了每行的小写检索串，一次 in 判断即可
+        if isinstance(model, CardTableModel):
+            return q in model.search_text(source_row)
         # 按列：1 假名、2 汉字、3 罗马音、4 释义
         cols = (1, 2, 3, 4)
-        q = self._query
         for c in cols:
             idx = model.index(source_row, c, source_parent)
             val = model.data(idx, QtCore.Qt.DisplayRole)
@@ -625,15 +695,30 @@ class CardTableModel(QtCore.QAbstractTableModel):
     3: 罗马音 (r[12])  # 你的库中 jp_kana 存放罗马音
     4: 释义 (r[4])
     5: 操作(虚拟列，由 Delegate 绘制按钮)
+
+    数据按列存放（set_rows 时一次性拆列并 strip），data() 直接按行号取值，
+    不再对每次访问都做整行 tuple 的判空与 strip。
     """
     COLS = ["序号", "假名", "汉字写法", "罗马音", "释义", "操作"]
 
+    # 显示列 -> 数据库行下标
+    _SRC_INDEX = {1: 3, 2: 11, 3: 12, 4: 4}
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._rows = []  # 每个元素是数据库整行 tuple
+        self._id_to_row = {}  # card_id -> 行号，set_rows 时重建
+        self._col_id = []
+        self._text_cols = {c: [] for c in self._SRC_INDEX}  # 显示列 -> 该列所有行的文本
+        self._search = None  # 每行的小写检索串（首次过滤时才生成）
         # 排序用的角色：数值/时间可以放在 UserRole，显示给 DisplayRole
         self._sort_role = QtCore.Qt.UserRole + 1
 
+    @staticmethod
+    def _s(row, i):
+        return (row[i] or "").strip() if (
+                isinstance(row, (list, tuple)) and len(row) > i and row[i] is not None) else ""
+
     def rowCount(self, parent=QtCore.QModelIndex()):
         return len(self._rows)
 
@@ -648,48 +733,31 @@ class CardTableModel(QtCore.QAbstractTableModel):
     def data(self, index, role):
         if not index.isValid():
             return None
-        r = self._rows[index.row()]
+        row = index.row()
         col = index.column()
 
-        def _s(row, i):
-            return (row[i] or "").strip() if (
-                    isinstance(row, (list, tuple)) and len(row) > i and row[i] is not None) else ""
-
         if role == self._sort_role:
             if col == 0:
-                return index.row()
-            elif col == 1:  # 假名(term)
-                return _s(r, 3)
-            elif col == 2:  # 汉字(jp_kanji)
-                return _s(r, 11)
-            elif col == 3:  # 罗马音(用 jp_kana 存放罗马音或留空)
-                return _s(r, 12)
-            elif col == 4:  # 释义
-                return _s(r, 4)
-            else:
-                return ""
+                return row
+            texts = self._text_cols.get(col)
+            return texts[row] if texts is not None else ""
 
         if role == QtCore.Qt.DisplayRole:
             if col == 0:
-                return str(index.row() + 1)
-            elif col == 1:
-                return _s(r, 3)
-            elif col == 2:
-                return _s(r, 11)
-            elif col == 3:
-                return _s(r, 12)
-            elif col == 4:
-                return _s(r, 4)
-            elif col == 5:
+                return str(row + 1)
+            texts = self._text_cols.get(col)
+            if texts is not None:
+                return texts[row]
+            if col == 5:
                 return ""
         return None
 
-    def card_id_at(self, row_idx):
-        r = self.row_at(row_idx)
-        try:
-            return int(r[0]) if (r and len(r) > 0 and r[0] is not None) else -1
-        except Exception:
-            return -1
+    def search_text(self, row_idx) -> str:
+        """假名/汉字/罗马音/释义拼成的小写串（列间用 \\x00 分隔，避免跨列误命中），供过滤用。"""
+        if self._search is None:
+            cols = [self._text_cols[c] for c in (1, 2, 3, 4)]
+            self._search = ["\x00".join(vals).lower() for vals in zip(*cols)]
+        return self._search[row_idx]
 
     def flags(self, index):
         if not index.isValid():
@@ -700,16 +768,26 @@ class CardTableModel(QtCore.QAbstractTableModel):
     def set_rows(self, rows):
         self.beginResetModel()
         self._rows = list(rows) if rows else []
+        self._col_id = [r[0] if r else None for r in self._rows]
+        self._text_cols = {c: [self._s(r, i) for r in self._rows] for c, i in self._SRC_INDEX.items()}
+        self._search = None
+        self._id_to_row = {cid: i for i, cid in enumerate(self._col_id) if cid is not None}
         self.endResetModel()
 
+    def row_for_id(self, card_id) -> int:
+        """card_id -> 源模型行号；不存在返回 -1。"""
+        return self._id_to_row.get(card_id, -1)
+
     def row_at(self, row_idx):
         if 0 <= row_idx < len(self._rows):
             return self._rows[row_idx]
         return None
 
     def card_id_at(self, row_idx):
-        r = self.row_at(row_idx)
-        return int(r[0]) if r and r[0] is not None else -1
+        if 0 <= row_idx < len(self._col_id):
+            cid = self._col_id[row_idx]
+            return int(cid) if cid is not None else -1
+        return -1
 
 
 class CandidatePopup(QtWidgets.QListWidget):
@@ -850,82 +928,99 @@ class KanaCandidatePopup(QtWidgets.QListWidget):
 
 class OpButtonDelegate(QtWidgets.QStyledItemDelegate):
     """
-    操作列 Delegate：绘制“编辑 / 删除”胶囊按钮，处理点击。
-    对外发射两个信号，传 card_id。
+    操作列 Delegate：用 QPainter 直接绘制“发音 / 编辑 / 删除”三个图标按钮，处理点击。
+    只画可见行，不再为每行创建 QWidget + QToolButton，数据重置后也无需重建。
+    发音信号传假名文本，编辑/删除信号传 card_id。
     """
+    speakRequested = QtCore.pyqtSignal(str)
     editRequested = QtCore.pyqtSignal(int)
     deleteRequested = QtCore.pyqtSignal(int)
 
     def __init__(self, model: CardTableModel, parent=None):
         super().__init__(parent)
         self.model = model
-        self._padding = 6
-        self._btn_w = 56
-        self._btn_h = 24
-        self._gap = 8
+        self._padding = 4
+        self._btn = 24
+        self._icon = 16
+        self._gap = 4
+
+        # 图标只在这里取一次并转成位图；取不到时退回文字符号（与旧按钮一致）
+        style = parent.style() if parent is not None else QtWidgets.QApplication.style()
+        self._buttons = (
+            (self._to_pixmap(style.standardIcon(QtWidgets.QStyle.SP_MediaPlay)), "🔊", "发音"),
+            (self._to_pixmap(QtGui.QIcon.fromTheme("document-edit")), "✎", "编辑"),
+            (self._to_pixmap(style.standardIcon(QtWidgets.QStyle.SP_TrashIcon)), "🗑", "删除"),
+        )
 
-    def paint(self, painter, option, index):
-        painter.save()
-        r = option.rect
+    def _to_pixmap(self, icon: QtGui.QIcon):
+        return None if icon.isNull() else icon.pixmap(self._icon, self._icon)
 
-        # 两个按钮的矩形
-        edit_rect = QtCore.QRect(
-            r.left() + self._padding,
-            r.center().y() - self._btn_h // 2,
-            self._btn_w, self._btn_h
-        )
-        del_rect = QtCore.QRect(
-            edit_rect.right() + self._gap,
-            edit_rect.top(),
-            self._btn_w, self._btn_h
-        )
+    def _button_rects(self, r: QtCore.QRect):
+        top = r.center().y() - self._btn // 2
+        x = r.left() + self._padding
+        rects = []
+        for _ in self._buttons:
+            rects.append(QtCore.QRect(x, top, self._btn, self._btn))
+            x += self._btn + self._gap
+        return rects
 
-        # 绘制按钮外观（跟你现有样式尽量接近）
-        def draw_btn(rect, text, danger=False):
-            path = QtGui.QPainterPath()
-            path.addRoundedRect(rect, 8, 8)
-            if danger:
-                painter.fillPath(path, QtGui.QColor("#ffebee"))
-                pen = QtGui.QPen(QtGui.QColor("#c62828"))
-            else:
-                painter.fillPath(path, QtGui.QColor("#e3f2fd"))
-                pen = QtGui.QPen(QtGui.QColor("#1565c0"))
-            painter.setPen(pen)
-            painter.drawPath(path)
-            painter.drawText(rect, QtCore.Qt.AlignCenter, text)
+    def _hit(self, r: QtCore.QRect, pos) -> int:
+        for i, rect in enumerate(self._button_rects(r)):
+            if rect.contains(pos):
+                return i
+        return -1
 
-        draw_btn(edit_rect, "编辑", danger=False)
-        draw_btn(del_rect, "删除", danger=True)
+    def paint(self, painter, option, index):
+        # 背景/选中态按默认方式绘制（该列文本为空）
+        super().paint(painter, option, index)
 
+        painter.save()
+        selected = bool(option.state & QtWidgets.QStyle.State_Selected)
+        painter.setPen(option.palette.color(
+            QtGui.QPalette.HighlightedText if selected else QtGui.QPalette.Text))
+        off = (self._btn - self._icon) // 2
+        for (pm, text, _tip), rect in zip(self._buttons, self._button_rects(option.rect)):
+            if pm is not None:
+                painter.drawPixmap(QtCore.QRect(rect.left() + off, rect.top() + off, self._icon, self._icon), pm)
+            else:
+                painter.drawText(rect, QtCore.Qt.AlignCenter, text)
         painter.restore()
 
     def editorEvent(self, event, model, option, index):
         if event.type() == QtCore.QEvent.MouseButtonRelease and event.button() == QtCore.Qt.LeftButton:
-            r = option.rect
-            edit_rect = QtCore.QRect(r.left() + self._padding, r.center().y() - self._btn_h // 2, self._btn_w,
-                                     self._btn_h)
-            del_rect = QtCore.QRect(edit_rect.right() + self._gap, edit_rect.top(), self._btn_w, self._btn_h)
-            pos = event.pos()
+            which = self._hit(option.rect, event.pos())
+            if which < 0:
+                return False
 
             # 关键：把代理索引映射回源模型
             try:
                 if isinstance(model, QtCore.QSortFilterProxyModel):
-                    src_index = model.mapToSource(index)
-                    row = src_index.row()
+                    row = model.mapToSource(index).row()
                 else:
                     row = index.row()
                 cid = self.model.card_id_at(row)
             except Exception:
                 return False
 
-            if edit_rect.contains(pos):
-                self.editRequested.emit(cid);
-                return True
-            if del_rect.contains(pos):
-                self.deleteRequested.emit(cid);
-                return True
+            if which == 0:
+                term = self.model.data(self.model.index(row, 1), QtCore.Qt.DisplayRole) or ""
+                self.speakRequested.emit(term)
+            elif which == 1:
+                self.editRequested.emit(cid)
+            else:
+                self.deleteRequested.emit(cid)
+            return True
         return False
 
+    def helpEvent(self, event, view, option, index):
+        # 悬停提示：按鼠标所在的按钮显示“发音/编辑/删除”
+        if event.type() == QtCore.QEvent.ToolTip:
+            which = self._hit(option.rect, event.pos())
+            if which >= 0:
+                QtWidgets.QToolTip.showText(event.globalPos(), self._buttons[which][2], view)
+                return True
+        return super().helpEvent(event, view, option, index)
+
 class LocalJaZhDict:
     def __init__(self, path: str | None = None):
         self.path = (path or "").strip()
@@ -1093,7 +1188,7 @@ class LocalJaZhDict:
 
             if kana:
                 score += 3
-            if term and any(0x4E00 <= ord(c) <= 0x9FFF for c in term):
+            if term and _HAN_RE.search(term):
                 score += 2
 
             key = (term or "", kana or "", mean or "")
@@ -1139,13 +1234,50 @@ def suggest_from_zh_meaning(zh: str) -> tuple[str, str, str] | None:
     except Exception:
         return None
 
+
+# 输入框联想会对同一个键反复查词典（中文释义反查是整表扫描），结果按键做 LRU 缓存；
+# 词典重新加载后必须调用 _clear_dict_caches()，否则会返回旧词典的结果
+@functools.lru_cache(maxsize=2048)
+def _suggest_full_cached(key: str) -> tuple[str, str, str] | None:
+    return suggest_full_entry(key)
+
+
+@functools.lru_cache(maxsize=2048)
+def _suggest_from_zh_cached(zh: str) -> tuple[str, str, str] | None:
+    return suggest_from_zh_meaning(zh)
+
+
+@functools.lru_cache(maxsize=512)
+def _search_by_meaning_cached(zh: str, limit: int = 8) -> tuple:
+    return tuple(_LOCAL_DICT.search_by_meaning(zh, limit=limit))
+
+
+def _clear_dict_caches():
+    _suggest_full_cached.cache_clear()
+    _suggest_from_zh_cached.cache_clear()
+    _search_by_meaning_cached.cache_clear()
+
 # --------------------------
 # SM-2 算法（保持不变）
 # --------------------------
-def sm2_update(card_row, quality):
-    interval = card_row[7]
-    repetition = card_row[8]
-    ef = card_row[9]
+# cards 表的一行（列顺序与 SELECT * 一致）；仍是 tuple，row[3] 这类下标访问照常可用
+Card = namedtuple('Card', [
+    'id', 'language', 'unit', 'term', 'meaning', 'created_at', 'last_review',
+    'interval', 'repetition', 'ef', 'due_date', 'jp_kanji', 'jp_kana', 'jp_ruby',
+])
+
+
+def to_card(row) -> Card:
+    """DB 行转 Card；旧库缺少 jp_* 列时补 None"""
+    n = len(Card._fields)
+    row = tuple(row[:n])
+    return Card._make(row + (None,) * (n - len(row)))
+
+
+def sm2_update(card: Card, quality):
+    interval = card.interval
+    repetition = card.repetition
+    ef = card.ef
     q = quality
     if q < 3:
         repetition = 0
@@ -1238,24 +1370,26 @@ def _find_duplicate_card(conn, unit: str, kana: str, kanji: str) -> int | None:
     return int(row[0]) if row else None
 
 
+# CJK 统一汉字（与下方 _has_kanji 的范围一致）；re.search 在 C 层扫描，比逐字 ord() 判断快
+_HAN_RE = re.compile(r"[\u4E00-\u9FFF]")
+# 平假名 + 片假名（与 _has_kana 的范围一致）
+_KANA_RE = re.compile(r"[\u3040-\u30FF]")
+# 日文字符：平/片假名 + 片假名扩展 + 汉字（供 _is_japanese_like 使用）
+_JP_RE = re.compile(r"[\u3040-\u30FF\u31F0-\u31FF\u4E00-\u9FFF]")
+
+
 def _has_kana(s: str) -> bool:
-    if not s:
-        return False
-    for ch in s:
-        code = ord(ch)
-        if (0x3040 <= code <= 0x309F) or (0x30A0 <= code <= 0x30FF):
-            return True
-    return False
+    return bool(s) and _KANA_RE.search(s) is not None
 
 
 def _has_kanji(s: str) -> bool:
-    if not s:
-        return False
-    for ch in s:
-        code = ord(ch)
-        if 0x4E00 <= code <= 0x9FFF:
-            return True
-    return False
+    return bool(s) and _HAN_RE.search(s) is not None
+
+
+@functools.lru_cache(maxsize=256)
+def _classify_jp(s: str) -> tuple[bool, bool]:
+    """一次性判断 (含假名, 含汉字)；同一输入在一次按键内会被多处询问，做小缓存。"""
+    return _has_kana(s), _has_kanji(s)
 
 
 def _kata_to_hira(s: str) -> str:
@@ -1285,12 +1419,14 @@ def _hira_to_kata(s: str) -> str:
             res.append(ch)
     return "".join(res)
 
+@functools.lru_cache(maxsize=1024)
 def romaji_to_kana_relaxed(s: str) -> tuple[str, str]:
     """
     宽松版：给“罗马音输入法”用。
     - 先尝试严格解析；
     - 若失败，退回到【最长合法前缀】；
     - 永远返回 (hira, kata) 二元组，不抛异常、不返回 None。
+    - 结果按输入串缓存（退格/重输同一串时不再逐个前缀重试）。
     """
     s = (s or "").strip().lower()
     if not s:
@@ -1317,46 +1453,50 @@ def romaji_to_kana_relaxed(s: str) -> tuple[str, str]:
 
 
 
+# 假名 → 罗马音对照表：模块级常量，避免每次调用 kana_to_romaji 都重建字典
+_KANA_DIGRAPH = {
+    "きゃ": "kya", "きゅ": "kyu", "きょ": "kyo",
+    "ぎゃ": "gya", "ぎゅ": "gyu", "ぎょ": "gyo",
+    "しゃ": "sha", "しゅ": "shu", "しょ": "sho",
+    "じゃ": "ja", "じゅ": "ju", "じょ": "jo",
+    "ちゃ": "cha", "ちゅ": "chu", "ちょ": "cho",
+    "にゃ": "nya", "にゅ": "nyu", "にょ": "nyo",
+    "ひゃ": "hya", "ひゅ": "hyu", "ひょ": "hyo",
+    "びゃ": "bya", "びゅ": "byu", "びょ": "byo",
+    "ぴゃ": "pya", "ぴゅ": "pyu", "ぴょ": "pyo",
+    "みゃ": "mya", "みゅ": "myu", "みょ": "myo",
+    "りゃ": "rya", "りゅ": "ryu", "りょ": "ryo",
+    "ゔぁ": "va", "ゔぃ": "vi", "ゔぇ": "ve", "ゔぉ": "vo",
+}
+_KANA_MONO = {
+    "あ": "a", "い": "i", "う": "u", "え": "e", "お": "o",
+    "か": "ka", "き": "ki", "く": "ku", "け": "ke", "こ": "ko",
+    "が": "ga", "ぎ": "gi", "ぐ": "gu", "げ": "ge", "ご": "go",
+    "さ": "sa", "し": "shi", "す": "su", "せ": "se", "そ": "so",
+    "ざ": "za", "じ": "ji", "ず": "zu", "ぜ": "ze", "ぞ": "zo",
+    "た": "ta", "ち": "chi", "つ": "tsu", "て": "te", "と": "to",
+    "だ": "da", "ぢ": "ji", "づ": "zu", "で": "de", "ど": "do",
+    "な": "na", "に": "ni", "ぬ": "nu", "ね": "ne", "の": "no",
+    "は": "ha", "ひ": "hi", "ふ": "fu", "へ": "he", "ほ": "ho",
+    "ば": "ba", "び": "bi", "ぶ": "bu", "べ": "be", "ぼ": "bo",
+    "ぱ": "pa", "ぴ": "pi", "ぷ": "pu", "ぺ": "pe", "ぽ": "po",
+    "ま": "ma", "み": "mi", "む": "mu", "め": "me", "も": "mo",
+    "や": "ya", "ゆ": "yu", "よ": "yo",
+    "ら": "ra", "り": "ri", "る": "ru", "れ": "re", "ろ": "ro",
+    "わ": "wa", "を": "o", "ん": "n",
+    "ぁ": "a", "ぃ": "i", "ぅ": "u", "ぇ": "e", "ぉ": "o",
+    "ゔ": "vu", "ゎ": "wa", "ゕ": "ka", "ゖ": "ka",
+    "ー": "-",  # 长音符，后面单独处理
+    "っ": "",  # 促音，靠后面首辅音加倍
+}
+
+
 def kana_to_romaji(kana: str) -> str:
     if not kana:
         return ""
     k = _kata_to_hira(kana)
-
-    digraph = {
-        "きゃ": "kya", "きゅ": "kyu", "きょ": "kyo",
-        "ぎゃ": "gya", "ぎゅ": "gyu", "ぎょ": "gyo",
-        "しゃ": "sha", "しゅ": "shu", "しょ": "sho",
-        "じゃ": "ja", "じゅ": "ju", "じょ": "jo",
-        "ちゃ": "cha", "ちゅ": "chu", "ちょ": "cho",
-        "にゃ": "nya", "にゅ": "nyu", "にょ": "nyo",
-        "ひゃ": "hya", "ひゅ": "hyu", "ひょ": "hyo",
-        "びゃ": "bya", "びゅ": "byu", "びょ": "byo",
-        "ぴゃ": "pya", "ぴゅ": "pyu", "ぴょ": "pyo",
-        "みゃ": "mya", "みゅ": "myu", "みょ": "myo",
-        "りゃ": "rya", "りゅ": "ryu", "りょ": "ryo",
-        "ゔぁ": "va", "ゔぃ": "vi", "ゔぇ": "ve", "ゔぉ": "vo",
-    }
-    mono = {
-        "あ": "a", "い": "i", "う": "u", "え": "e", "お": "o",
-        "か": "ka", "き": "ki", "く": "ku", "け": "ke", "こ": "ko",
-        "が": "ga", "ぎ": "gi", "ぐ": "gu", "げ": "ge", "ご": "go",
-        "さ": "sa", "し": "shi", "す": "su", "せ": "se", "そ": "so",
-        "ざ": "za", "じ": "ji", "ず": "zu", "ぜ": "ze", "ぞ": "zo",
-        "た": "ta", "ち": "chi", "つ": "tsu", "て": "te", "と": "to",
-        "だ": "da", "ぢ": "ji", "づ": "zu", "で": "de", "ど": "do",
-        "な": "na", "に": "ni", "ぬ": "nu", "ね": "ne", "の": "no",
-        "は": "ha", "ひ": "hi", "ふ": "fu", "へ": "he", "ほ": "ho",
-        "ば": "ba", "び": "bi", "ぶ": "bu", "べ": "be", "ぼ": "bo",
-        "ぱ": "pa", "ぴ": "pi", "ぷ": "pu", "ぺ": "pe", "ぽ": "po",
-        "ま": "ma", "み": "mi", "む": "mu", "め": "me", "も": "mo",
-        "や": "ya", "ゆ": "yu", "よ": "yo",
-        "ら": "ra", "り": "ri", "る": "ru", "れ": "re", "ろ": "ro",
-        "わ": "wa", "を": "o", "ん": "n",
-        "ぁ": "a", "ぃ": "i", "ぅ": "u", "ぇ": "e", "ぉ": "o",
-        "ゔ": "vu", "ゎ": "wa", "ゕ": "ka", "ゖ": "ka",
-        "ー": "-",  # 长音符，后面单独处理
-        "っ": "",  # 促音，靠后面首辅音加倍
-    }
+    digraph = _KANA_DIGRAPH
+    mono = _KANA_MONO
 
     res = []
     i = 0
@@ -1399,6 +1539,10 @@ def kana_to_romaji(kana: str) -> str:
     return "".join(out)
 
 
+# 同一假名会被反复转换（候选回填、按键联想等），结果只依赖输入，直接做 LRU 缓存
+_romaji_cached = functools.lru_cache(maxsize=4096)(kana_to_romaji)
+
+
 def romaji_to_kana(roma: str) -> tuple[str, str] | None:
     """
     把罗马音解析成（平假名, 片假名）。
@@ -1548,7 +1692,7 @@ def pick_romaji(row, kana_text: str) -> str:
     jp_kana = get_jp_kana(row)
     if _is_romaji(jp_kana):
         return jp_kana.strip()
-    return kana_to_romaji(kana_text) if kana_text else ""
+    return _romaji_cached(kana_text) if kana_text else ""
 
 
 # --- 2) 新增：按 id 读取完整卡片 ---
@@ -1616,6 +1760,7 @@ def load_custom_font(app):
 
     return family_name
 
+@functools.lru_cache(maxsize=8)
 def get_app_style(font_family):
     """
     动态生成 CSS。
@@ -1765,6 +1910,89 @@ def get_app_style(font_family):
     }}
     """
 
+
+# 夜间模式覆盖层 (Dark Mode Overlay)：叠加在 get_app_style 之上
+# 增加了 QDialog, QTableCornerButton 的支持
+DARK_THEME_CSS = """
+    /* 全局深色背景 */
+    QMainWindow, QWidget, QDialog { 
+        background-color: #111827; 
+        color: #e5e7eb; 
+    }
+    
+    /* 面板背景 */
+    QFrame#panel { background-color: #1f2937; border-color: #374151; }
+    
+    /* 文字颜色 */
+    QLabel#appTitle, QLabel#sectionTitle, QLabel#bigterm { color: #f3f4f6; }
+    QLabel, QCheckBox, QRadioButton { color: #e5e7eb; }
+    QLabel#muted { color: #9ca3af; }
+    
+    /* 输入框 */
+    QLineEdit, QTextEdit, QPlainTextEdit, QComboBox { 
+        background-color: #374151; 
+        color: #f3f4f6; 
+        border: 1px solid #4b5563; 
+        selection-background-color: #2563eb;
+    }
+    
+    /* 表格与列表 (核心修复) */
+    QListWidget, QTableWidget, QTableView { 
+        background-color: #1f2937; 
+        color: #f3f4f6; 
+        border: 1px solid #374151; 
+        alternate-background-color: #111827; /* 偶数行深色，修复白色条纹 */
+        gridline-color: #374151;
+    }
+    QListWidget::item:selected, QTableWidget::item:selected, QTableView::item:selected {
+        background-color: #1e40af; 
+        color: #ffffff;
+    }
+    /* 表格左上角空白块修复 */
+    QTableCornerButton::section {
+        background-color: #374151;
+        border: 1px solid #4b5563;
+    }
+    
+    /* 表头 */
+    QHeaderView::section { 
+        background-color: #374151; 
+        color: #d1d5db; 
+        border: none;
+        border-bottom: 1px solid #4b5563; 
+        border-right: 1px solid #4b5563;
+    }
+    
+    /* 按钮 */
+    QPushButton { background-color: #374151; color: #e5e7eb; border: 1px solid #4b5563; }
+    QPushButton:hover { background-color: #4b5563; }
+    
+    QPushButton#primary { background-color: #2563eb; color: white; border: 1px solid #2563eb; }
+    QPushButton#primary:hover { background-color: #1d4ed8; }
+    
+    QPushButton#miniDanger { background-color: #7f1d1d; color: #fca5a5; border-color: #7f1d1d; }
+    QPushButton#miniDanger:hover { background-color: #991b1b; }
+    
+    /* 滚动条美化 (可选，防止原生白色滚动条太刺眼) */
+    QScrollBar:vertical {
+        border: none;
+        background: #111827;
+        width: 10px;
+        margin: 0px;
+    }
+    QScrollBar::handle:vertical {
+        background: #4b5563;
+        min-height: 20px;
+        border-radius: 5px;
+    }
+"""
+
+
+@functools.lru_cache(maxsize=8)
+def get_app_style_dark(font_family):
+    """夜间模式样式 = 日间样式 + 深色覆盖层；按字体缓存，切换主题时不再重复拼接。"""
+    return get_app_style(font_family) + DARK_THEME_CSS
+
 def _register_zen_maru_font():
     """注册 Zen Maru Gothic 字体，并把它设为 QApplication 的默认字体。"""
     try:
@@ -1795,6 +2023,50 @@ def apply_shadow(widget, radius=18, color=QtGui.QColor(17, 17, 17, 40), offset=(
     widget.setGraphicsEffect(effect)
 
 
+# TTS 引擎：全程序共用一个，首次用到时才创建并挑日语语音（枚举系统语音较慢）
+_TTS = None
+_TTS_LOCALE = None
+_TTS_SPEAKING = False  # 由 stateChanged 维护，避免空闲时也去 stop()/查询 state()
+
+
+def _on_tts_state(state):
+    global _TTS_SPEAKING
+    _TTS_SPEAKING = state == QtTextToSpeech.QTextToSpeech.Speaking
+
+
+def _get_tts():
+    global _TTS, _TTS_LOCALE
+    if _TTS is None:
+        _TTS = QtTextToSpeech.QTextToSpeech()
+        _TTS.stateChanged.connect(_on_tts_state)
+        for locale in _TTS.availableLocales():
+            if locale.name().startswith("ja"):
+                _TTS_LOCALE = locale
+                break
+        if _TTS_LOCALE is not None:
+            _TTS.setLocale(_TTS_LOCALE)
+        else:
+            print("[TTS] Warning: No Japanese TTS voice found. Using default.")
+    return _TTS
+
+
+def _tts_stop():
+    """只有正在朗读时才 stop，空闲时不打扰后端。"""
+    if _TTS is not None and _TTS_SPEAKING:
+        _TTS.stop()
+
+
+def _tts_say(text: str):
+    """打断当前朗读（如有）并朗读 text。"""
+    global _TTS_SPEAKING
+    if not text:
+        return
+    tts = _get_tts()
+    _tts_stop()
+    tts.say(text)
+    _TTS_SPEAKING = True  # 部分后端 state 变化是异步的，先置位，Ready 时由回调清掉
+
+
 class UnitListWidget(QtWidgets.QListWidget):
     orderChanged = QtCore.pyqtSignal(list)
 
@@ -1822,9 +2094,13 @@ class UnitListWidget(QtWidgets.QListWidget):
 
 
 class MainWindow(QtWidgets.QMainWindow):
+    _AUTO_WIDTH_COLS = (0, 2, 3)  # 单元表中按内容定宽的列：ID / 汉字 / 罗马音
+
     def __init__(self):
         super().__init__()
         self.db = init_db()
+        self._rows_cache = {}  # 单元名(None=所有单元) -> 卡片行；增删改后由 _invalidate_rows 失效
+        self._unit_item_index = {}  # 单元名 -> 左侧列表项；refresh_units 重建，增删单元时同步
         self.setWindowTitle("LANSGANBS")
         self.resize(1180, 760)
         self.setMinimumSize(980, 620)
@@ -1856,6 +2132,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # —— 设置中心 ——
         self.settings = SettingsManager(SETTINGS_PATH).load()
+        self._cache_typed_settings()
 
         # 顶部标题栏（不再包含导入/导出/主题切换）
         header = QtWidgets.QHBoxLayout()
@@ -2095,6 +2372,8 @@ class MainWindow(QtWidgets.QMainWindow):
             # ... (Completer 代码可以复用你原来的，这里省略以节省篇幅，逻辑完全一致) ...
             pass
         except: pass
+        # 补全下拉的可见状态改由事件过滤器缓存，按键时不再逐个查询 popup().isVisible()
+        self._watch_completer_popups()
 
         add_row.addLayout(form_col, 1)
 
@@ -2164,6 +2443,17 @@ class MainWindow(QtWidgets.QMainWindow):
         self._proxy.setSourceModel(self._card_model)
         self.unit_table.setModel(self._proxy)
 
+        # 操作列：由 Delegate 统一绘制三个图标按钮（不再逐行 setIndexWidget）
+        self._op_delegate = OpButtonDelegate(self._card_model, self.unit_table)
+        self._op_delegate.speakRequested.connect(self.speak_text)
+        self._op_delegate.editRequested.connect(self._edit_card_by_id)
+        self._op_delegate.deleteRequested.connect(self._delete_card_by_id)
+        self.unit_table.setItemDelegateForColumn(5, self._op_delegate)
+
+        # 表格不可见时（窗口隐藏/最小化到托盘等）先暂存待刷新的行，显示时再一次性写入
+        self._pending_rows = None
+        self.unit_table.installEventFilter(self)
+
         # 表格样式微调
         self.unit_table.verticalHeader().setVisible(False)
         self.unit_table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
@@ -2200,6 +2490,14 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self._suppress_cand_for = ""  # 记住“当前不再自动弹候选”的中文文本
 
+        # 视图状态：须在 refresh_units() 之前就绪，否则启动时载入的“所有单元”会被随后重置成空表
+        self._current_unit = None
+        self._current_rows_all = []  # 原始（当前单元）
+        self._current_rows_view = []  # 过滤/排序/打乱后的“当前显示”
+        self._shuffled = False
+        self._shuffle_rank = None  # 打乱顺序缓存：card_id -> 名次
+        self._refresh_pending = False  # 已排队等待刷新表格（见 _schedule_refresh）
+
         # UI 初始化
         self.refresh_units()
         btn_new_unit.setIcon(self.style().standardIcon(QtWidgets.QStyle.SP_FileDialogNewFolder))
@@ -2283,12 +2581,6 @@ class MainWindow(QtWidgets.QMainWindow):
         self.shortcut_space = QtWidgets.QShortcut(QtGui.QKeySequence("Space"), self)
         self.shortcut_space.activated.connect(self.on_space_pressed)
 
-        # --- 在 MainWindow.__init__ 末尾附近（UI 初始化后）追加状态与信号 ---
-        self._current_unit = None
-        self._current_rows_all = []  # 原始（当前单元）
-        self._current_rows_view = []  # 过滤/排序/打乱后的“当前显示”
-        self._shuffled = False
-
         # —— 新增：测验窗口句柄（单例）
         self._kana_quiz_window = None
 
@@ -2309,17 +2601,8 @@ class MainWindow(QtWidgets.QMainWindow):
         self.add_mean.textEdited.connect(lambda _=None: setattr(self, "_meaning_autofilled", False))
         self.add_mean.textEdited.connect(lambda _=None: setattr(self, "_suppress_cand_for", ""))
 
-        # === 新增功能：初始化 TTS ===
-        self.speech = QtTextToSpeech.QTextToSpeech()
-        # 尝试优先设置日语引擎
-        found_ja = False
-        for locale in self.speech.availableLocales():
-            if locale.name().startswith("ja"):
-                self.speech.setLocale(locale)
-                found_ja = True
-                break
-        if not found_ja:
-            print("[MainWindow] Warning: No Japanese TTS voice found. Using default.")
+        # === 新增功能：初始化 TTS（共用实例，见 _get_tts） ===
+        self.speech = _get_tts()
 
         # (注意：这里绝对不能有 self.prepare_queue()，那是 StudyWindow 里的)
 
@@ -2339,114 +2622,40 @@ class MainWindow(QtWidgets.QMainWindow):
         # 修复：先检查对象是否存在，防止初始化失败导致崩溃
         if not hasattr(self, 'speech') or self.speech is None:
             return
-        if self.speech.state() == QtTextToSpeech.QTextToSpeech.Speaking:
-            self.speech.stop()
-        self.speech.say(text)
+        _tts_say(text)
 
     def toggle_theme(self, checked):
         app = QtWidgets.QApplication.instance()
-        if checked:
-            self.btn_theme.setText("☀️ 日间模式")
-
-            # 1. 获取当前字体的 CSS (作为基础)
-            real_font = self.font().family()
-            base_css = get_app_style(real_font)
-
-            # 2. 定义夜间模式覆盖层 (Dark Mode Overlay)
-            # 增加了 QDialog, QTableCornerButton 的支持
-            dark_css = """
-            /* 全局深色背景 */
-            QMainWindow, QWidget, QDialog { 
-                background-color: #111827; 
-                color: #e5e7eb; 
-            }
-            
-            /* 面板背景 */
-            QFrame#panel { background-color: #1f2937; border-color: #374151; }
-            
-            /* 文字颜色 */
-            QLabel#appTitle, QLabel#sectionTitle, QLabel#bigterm { color: #f3f4f6; }
-            QLabel, QCheckBox, QRadioButton { color: #e5e7eb; }
-            QLabel#muted { color: #9ca3af; }
-            
-            /* 输入框 */
-            QLineEdit, QTextEdit, QPlainTextEdit, QComboBox { 
-                background-color: #374151; 
-                color: #f3f4f6; 
-                border: 1px solid #4b5563; 
-                selection-background-color: #2563eb;
-            }
-            
-            /* 表格与列表 (核心修复) */
-            QListWidget, QTableWidget, QTableView { 
-                background-color: #1f2937; 
-                color: #f3f4f6; 
-                border: 1px solid #374151; 
-                alternate-background-color: #111827; /* 偶数行深色，修复白色条纹 */
-                gridline-color: #374151;
-            }
-            QListWidget::item:selected, QTableWidget::item:selected, QTableView::item:selected {
-                background-color: #1e40af; 
-                color: #ffffff;
-            }
-            /* 表格左上角空白块修复 */
-            QTableCornerButton::section {
-                background-color: #374151;
-                border: 1px solid #4b5563;
-            }
-            
-            /* 表头 */
-            QHeaderView::section { 
-                background-color: #374151; 
-                color: #d1d5db; 
-                border: none;
-                border-bottom: 1px solid #4b5563; 
-                border-right: 1px solid #4b5563;
-            }
-            
-            /* 按钮 */
-            QPushButton { background-color: #374151; color: #e5e7eb; border: 1px solid #4b5563; }
-            QPushButton:hover { background-color: #4b5563; }
-            
-            QPushButton#primary { background-color: #2563eb; color: white; border: 1px solid #2563eb; }
-            QPushButton#primary:hover { background-color: #1d4ed8; }
-            
-            QPushButton#miniDanger { background-color: #7f1d1d; color: #fca5a5; border-color: #7f1d1d; }
-            QPushButton#miniDanger:hover { background-color: #991b1b; }
-            
-            /* 滚动条美化 (可选，防止原生白色滚动条太刺眼) */
-            QScrollBar:vertical {
-                border: none;
-                background: #111827;
-                width: 10px;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical {
-                background: #4b5563;
-                min-height: 20px;
-                border-radius: 5px;
-            }
-            """
-            # 应用全局样式
-            app.setStyleSheet(base_css + dark_css)
-        else:
-            self.btn_theme.setText("🌙 夜间模式")
-            # 恢复日间模式
-            real_font = self.font().family()
-            app.setStyleSheet(get_app_style(real_font))
+        self.btn_theme.setText("☀️ 日间模式" if checked else "🌙 夜间模式")
+
+        # 样式按字体缓存（见 get_app_style / get_app_style_dark），这里只取现成字符串
+        real_font = self.font().family()
+        css = get_app_style_dark(real_font) if checked else get_app_style(real_font)
+
+        # 与当前样式一致就不重设：setStyleSheet 会让所有控件重新 polish，代价很高
+        if app.styleSheet() == css:
+            return
+        self.setUpdatesEnabled(False)
+        try:
+            app.setStyleSheet(css)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def _filter_units(self, text: str):
         q = (text or "").strip().lower()
-        # 逐项隐藏/显示，但不改变原有排序与拖拽顺序
-        for i in range(self.unit_list.count()):
-            it = self.unit_list.item(i)
-            name = (it.text() or "").strip()
-            if not q:
-                it.setHidden(False)
-                continue
-            show = (q in name.lower())
-            # “所有单元”仅在匹配时显示；不强制置顶（保持原顺序）
-            it.setHidden(not show)
+        # 逐项隐藏/显示，但不改变原有排序与拖拽顺序（仍保留 QListWidget 以支持拖拽排序）
+        # 批量处理：关闭重绘，且只对状态真正变化的项调用 setHidden，避免每次按键都触发逐行布局
+        lst = self.unit_list
+        lst.setUpdatesEnabled(False)
+        try:
+            for i in range(lst.count()):
+                it = lst.item(i)
+                # “所有单元”仅在匹配时显示；不强制置顶（保持原顺序）
+                hide = bool(q) and (q not in (it.text() or "").strip().lower())
+                if it.isHidden() != hide:
+                    it.setHidden(hide)
+        finally:
+            lst.setUpdatesEnabled(True)
 
         # 若当前选中项被隐藏，则自动选中第一条可见项
         cur = self.unit_list.currentItem()
@@ -2518,7 +2727,33 @@ class MainWindow(QtWidgets.QMainWindow):
             except Exception:
                 pass
 
+    def _watch_completer_popups(self):
+        """给 add_term / add_kanji 的补全下拉装事件过滤器，缓存其显示/隐藏状态。"""
+        self._term_completer_visible = False
+        self._kanji_completer_visible = False
+        self._completer_popups = []
+        for edit, attr in ((self.add_term, "_term_completer_visible"),
+                           (self.add_kanji, "_kanji_completer_visible")):
+            try:
+                c = edit.completer()
+                popup = c.popup() if c else None
+            except Exception:
+                popup = None
+            if popup is not None:
+                popup.installEventFilter(self)
+                self._completer_popups.append((popup, attr))
+
     def eventFilter(self, obj, e):
+        if e.type() in (QtCore.QEvent.Show, QtCore.QEvent.Hide):
+            for popup, attr in getattr(self, "_completer_popups", ()):
+                if obj is popup:
+                    setattr(self, attr, e.type() == QtCore.QEvent.Show)
+                    return False
+        if obj is getattr(self, "unit_table", None) and e.type() == QtCore.QEvent.Show:
+            rows, self._pending_rows = self._pending_rows, None
+            if rows is not None:
+                self.populate_unit_table(rows)
+            return False
         if hasattr(self, "filter_bar") and obj is self.filter_bar:
             if e.type() == QtCore.QEvent.KeyPress and e.key() == QtCore.Qt.Key_Escape:
                 self.filter_bar.clear()
@@ -2544,8 +2779,7 @@ class MainWindow(QtWidgets.QMainWindow):
             return
 
         # 若目标名已存在，直接提示
-        names = [self.unit_list.item(i).text().strip() for i in range(self.unit_list.count())]
-        if new in names:
+        if self._unit_item(new) is not None:
             QtWidgets.QMessageBox.warning(self, "重名", f"已存在名为「{new}」的单元。")
             return
 
@@ -2556,6 +2790,7 @@ class MainWindow(QtWidgets.QMainWindow):
                 cur = self.db.cursor()
                 cur.execute("UPDATE cards SET unit=? WHERE unit=?", (new, old))
                 self.db.commit()
+                self._invalidate_rows(old, new)
             else:
                 # 空单元：只在左侧列表与会话临时集合中存在
                 if hasattr(self, "_adhoc_units"):
@@ -2564,10 +2799,10 @@ class MainWindow(QtWidgets.QMainWindow):
                     self._adhoc_units.add(new)
             # 刷新列表并选中新名
             self.refresh_units()
-            items = self.unit_list.findItems(new, QtCore.Qt.MatchExactly)
-            if items:
-                self.unit_list.setCurrentItem(items[0])
-                self.on_unit_clicked(items[0])
+            it = self._unit_item(new)
+            if it is not None:
+                self.unit_list.setCurrentItem(it)
+                self.on_unit_clicked(it)
 
             # 如果你已做“单元顺序持久化”，这里顺带替换顺序表里的名字
             try:
@@ -2668,6 +2903,7 @@ class MainWindow(QtWidgets.QMainWindow):
                 pass
 
         # 刷新当前视图
+        self._invalidate_rows()
         it = self.unit_list.currentItem()
         if it:
             self.on_unit_clicked(it)
@@ -2703,21 +2939,47 @@ class MainWindow(QtWidgets.QMainWindow):
         if reply != QtWidgets.QMessageBox.Yes:
             return
 
+        # 先清行缓存：之后无论成败都不会再用到恢复前的行
+        self._invalidate_rows()
+        err = None
         try:
             # 关闭现有连接
             try:
                 self.db.close()
             except Exception:
                 pass
-            # 覆盖数据库文件
-            shutil.copy2(path, DB_PATH)
-            # 重新打开并初始化（含迁移/索引）
-            self.db = init_db(DB_PATH)
+            # 用 SQLite 在线备份 API 一次性覆盖（不会留下半截文件，也会正确处理 WAL 日志）。
+            # 目标库先切出 WAL：WAL 模式下页大小与备份不同时 SQLite 无法写入
+            try:
+                src = sqlite3.connect(path)
+                dst = sqlite3.connect(DB_PATH)
+                try:
+                    dst.execute('PRAGMA journal_mode=DELETE')
+                    src.backup(dst)
+                finally:
+                    src.close()
+                    dst.close()
+            except sqlite3.Error:
+                # 备份 API 不可用时退回直接拷文件（原先的做法）
+                shutil.copy2(path, DB_PATH)
+        except Exception as e:
+            err = e
+        finally:
+            # 重新打开并初始化（含迁移/索引）；恢复失败也要重开，避免窗口留着已关闭的连接
+            try:
+                self.db = init_db(DB_PATH)
+            except Exception as e:
+                err = err or e
+
+        try:
             # 刷新 UI
             self.refresh_units()
-            QtWidgets.QMessageBox.information(self, "恢复完成", "数据库已从备份恢复。")
         except Exception as e:
-            QtWidgets.QMessageBox.critical(self, "恢复失败", f"恢复时出错：{e}")
+            err = err or e
+        if err is None:
+            QtWidgets.QMessageBox.information(self, "恢复完成", "数据库已从备份恢复。")
+        else:
+            QtWidgets.QMessageBox.critical(self, "恢复失败", f"恢复时出错：{err}")
 
     def on_open_backup_dir(self):
         _ensure_dir(BACKUP_DIR)
@@ -2738,12 +3000,8 @@ class MainWindow(QtWidgets.QMainWindow):
             cur_unit = None if name == "所有单元" else name
 
         try:
-            if cur_unit is None:
-                rows = list_cards_by_unit(self.db, None)
-                title = "所有单元"
-            else:
-                rows = list_cards_by_unit(self.db, cur_unit)
-                title = cur_unit
+            rows = self._get_rows(cur_unit)
+            title = cur_unit if cur_unit is not None else "所有单元"
         except Exception as e:
             QtWidgets.QMessageBox.critical(self, "导出失败", f"查询数据失败：{e}")
             return
@@ -2841,7 +3099,7 @@ class MainWindow(QtWidgets.QMainWindow):
         # if force and meaning: self.add_mean.setText(meaning)
 
         # 2) 汉字写法：仅当 term 含汉字
-        if term and any(0x4E00 <= ord(c) <= 0x9FFF for c in term):
+        if term and _HAN_RE.search(term):
             cur = (self.add_kanji.text() or "").strip()
             if force or not cur or getattr(self, "_kanji_autofilled", True):
                 if not cur or cur != term:
@@ -2880,7 +3138,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
             # 4) 罗马音：有假名时自动回填（不覆盖手动）
             try:
-                romaji = kana_to_romaji(kana_to_use)  # 你工程已有此函数；若无则 try/except 保底
+                romaji = _romaji_cached(kana_to_use)  # 命中缓存时无需重新转换
             except Exception:
                 romaji = ""
             if romaji:
@@ -2944,7 +3202,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # 取候选
         try:
-            cands = _LOCAL_DICT.search_by_meaning(zh, limit=8)
+            cands = list(_search_by_meaning_cached(zh, 8))
         except Exception:
             cands = []
 
@@ -3027,6 +3285,17 @@ class MainWindow(QtWidgets.QMainWindow):
 
         rows = [r for r in rows if _hit(r)]
 
+        # 打乱：复用缓存的顺序，只有出现缓存之外的卡片时才重新洗牌；
+        # 打乱时规则排序的结果会被覆盖，因此直接跳过排序
+        if getattr(self, "_shuffled", False):
+            rank = self._shuffle_rank
+            if rank is None or any(r[0] not in rank for r in rows):
+                order = random.sample(range(len(rows)), len(rows))
+                rank = {rows[i][0]: n for n, i in enumerate(order)}
+                self._shuffle_rank = rank
+            rows.sort(key=lambda r: rank[r[0]])
+            return rows
+
         # 排序
         key = self.sort_combo.currentText()
         from datetime import datetime
@@ -3050,11 +3319,6 @@ class MainWindow(QtWidgets.QMainWindow):
         elif key == "易度EF":
             rows.sort(key=lambda r: float(r[9] or 0.0), reverse=True)
 
-        # 打乱
-        if getattr(self, "_shuffled", False):
-            import random
-            random.shuffle(rows)
-
         return rows
 
     def _apply_filters_and_refresh(self):
@@ -3066,8 +3330,20 @@ class MainWindow(QtWidgets.QMainWindow):
             # 退一步：清空表，避免直接崩溃
             self.populate_unit_table([])
 
+    def _schedule_refresh(self):
+        """合并刷新：同一拍内的多次请求只在事件循环空闲时执行一次 _apply_filters_and_refresh。"""
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        QtCore.QTimer.singleShot(0, self._do_refresh)
+
+    def _do_refresh(self):
+        self._refresh_pending = False
+        self._apply_filters_and_refresh()
+
     def _on_shuffle_clicked(self):
         self._shuffled = not self._shuffled
+        self._shuffle_rank = None  # 每次点击“打乱”都重新洗牌
         self._apply_filters_and_refresh()
 
     # 3) 在 class MainWindow 内新增/替换以下方法
@@ -3122,19 +3398,20 @@ class MainWindow(QtWidgets.QMainWindow):
 
         try:
             delete_unit(self.db, unit)
+            self._invalidate_rows(unit)
             # 从左侧列表移除，并清理临时单元集合
-            matches = self.unit_list.findItems(unit, QtCore.Qt.MatchExactly)
-            for it in matches:
-                row = self.unit_list.row(it)
-                self.unit_list.takeItem(row)
+            it = self._unit_item(unit)
+            if it is not None:
+                self._unit_item_index.pop(unit, None)
+                self.unit_list.takeItem(self.unit_list.row(it))
             if hasattr(self, "_adhoc_units"):
                 self._adhoc_units.discard(unit)
 
             # 若正在查看该单元，则切回“所有单元”
-            cur = self.unit_list.findItems("所有单元", QtCore.Qt.MatchExactly)
-            if cur:
-                self.unit_list.setCurrentItem(cur[0])
-                self.on_unit_clicked(cur[0])
+            cur = self._unit_item("所有单元")
+            if cur is not None:
+                self.unit_list.setCurrentItem(cur)
+                self.on_unit_clicked(cur)
             QtWidgets.QMessageBox.information(self, "完成", f"已删除单元「{unit}」。")
         except Exception as e:
             QtWidgets.QMessageBox.critical(self, "错误", f"删除失败：{e}")
@@ -3185,6 +3462,8 @@ class MainWindow(QtWidgets.QMainWindow):
                 fg.moveCenter(geo.center())
                 self.study_win.move(fg.topLeft())
             self.study_win.destroyed.connect(lambda *_: setattr(self, "study_win", None))
+            # 复习会改写 last_review / repetition / ef 等字段，关闭后让行缓存失效
+            self.study_win.closed.connect(self._invalidate_rows)
             self.study_win.show()
             self.study_win.activateWindow()
             self.study_win.raise_()
@@ -3196,49 +3475,66 @@ class MainWindow(QtWidgets.QMainWindow):
         # 记住当前选中
         cur_text = self.unit_list.currentItem().text() if self.unit_list.currentItem() else None
 
-        self.unit_list.clear()
-        self.unit_list.addItem("所有单元")
-
         got = set(list_units(self.db))
 
         # 并入会话级临时单元（空单元也要显示/排序）
-        if hasattr(self, "_adhoc_units"):
-            got |= set(self._adhoc_units)
+        got |= set(getattr(self, "_adhoc_units", ()))
 
         # 读取已保存的顺序（不含“所有单元”）
-        order = list(self.settings.get("unit_order", []) or [])
+        order = self.settings.get("unit_order", []) or []
 
         # 用“已保存顺序在前，新增单元按字母顺序在后”的策略生成最终顺序
-        ordered = []
-        seen = set()
-        for name in order:
-            if name in got and name not in seen:
-                ordered.append(name);
-                seen.add(name)
-        for name in sorted(got):
-            if name not in seen:
-                ordered.append(name);
-                seen.add(name)
-
-        # 写回列表
-        for u in ordered:
-            self.unit_list.addItem(u)
+        # dict 保持插入顺序并自动去重，一趟合并即可
+        ordered = {name: None for name in order if name in got}
+        for name in sorted(got.difference(ordered)):
+            ordered[name] = None
+
+        # 写回列表（addItems 一次性插入，避免逐项 addItem）
+        # 重建期间暂停重绘、屏蔽列表信号，结束后统一刷新一次
+        lst = self.unit_list
+        lst.setUpdatesEnabled(False)
+        lst.blockSignals(True)
+        try:
+            lst.clear()
+            lst.addItems(["所有单元", *ordered])
+            # clear() 已销毁旧项，索引必须整体重建
+            self._unit_item_index = {lst.item(i).text(): lst.item(i) for i in range(lst.count())}
+        finally:
+            lst.blockSignals(False)
+            lst.setUpdatesEnabled(True)
+            lst.viewport().update()
 
         self.refresh_units_to_combo()
         self.refresh_study_units()
 
         # 尝试恢复选择
         if cur_text:
-            items = self.unit_list.findItems(cur_text, QtCore.Qt.MatchExactly)
-            if items:
-                self.unit_list.setCurrentItem(items[0])
+            it = self._unit_item(cur_text)
+            if it is not None:
+                self.unit_list.setCurrentItem(it)
 
         # 若当前没有任何选择，则默认选中“所有单元”并加载
         if not self.unit_list.currentItem():
-            items = self.unit_list.findItems("所有单元", QtCore.Qt.MatchExactly)
+            it = self._unit_item("所有单元")
+            if it is not None:
+                self.unit_list.setCurrentItem(it)
+                self.on_unit_clicked(it)
+
+    def _unit_item(self, name: str):
+        """单元名 -> 左侧列表项（字典 O(1)）；索引里没有时回退 findItems 并补登。"""
+        it = self._unit_item_index.get(name)
+        if it is None:
+            items = self.unit_list.findItems(name, QtCore.Qt.MatchExactly)
             if items:
-                self.unit_list.setCurrentItem(items[0])
-                self.on_unit_clicked(items[0])
+                it = self._unit_item_index[name] = items[0]
+        return it
+
+    def _add_unit_item(self, name: str):
+        """在左侧列表末尾追加单元，并同步索引。"""
+        self.unit_list.addItem(name)
+        it = self.unit_list.item(self.unit_list.count() - 1)
+        self._unit_item_index[name] = it
+        return it
 
     # python
     def refresh_study_units(self):
@@ -3257,7 +3553,7 @@ class MainWindow(QtWidgets.QMainWindow):
         if not zh:
             return
 
-        e = suggest_from_zh_meaning(zh)  # -> (e_term, e_kana, e_mean) or None
+        e = _suggest_from_zh_cached(zh)  # -> (e_term, e_kana, e_mean) or None
         if not e:
             # 没命中就安静返回
             return
@@ -3266,7 +3562,7 @@ class MainWindow(QtWidgets.QMainWindow):
         filled = []
 
         # 1) 补“汉字写法”：仅当 e_term 含汉字
-        if e_term and any(0x4E00 <= ord(c) <= 0x9FFF for c in e_term):
+        if e_term and _HAN_RE.search(e_term):
             cur = (self.add_kanji.text() or "").strip()
             if force or not cur or getattr(self, "_kanji_autofilled", True):
                 if not cur or cur != e_term:
@@ -3309,8 +3605,7 @@ class MainWindow(QtWidgets.QMainWindow):
         cur = self.add_unit_combo.currentText()
         self.add_unit_combo.blockSignals(True)
         self.add_unit_combo.clear()
-        for u in units:
-            self.add_unit_combo.addItem(u)
+        self.add_unit_combo.addItems(units)
         if cur:
             self.add_unit_combo.setCurrentText(cur)
         else:
@@ -3323,16 +3618,14 @@ class MainWindow(QtWidgets.QMainWindow):
             name = text.strip()
 
             # 左侧列表立即加入，并选中该单元
-            names = [self.unit_list.item(i).text() for i in range(self.unit_list.count())]
-            if name not in names:
-                self.unit_list.addItem(name)
+            it = self._unit_item(name)
+            if it is None:
+                it = self._add_unit_item(name)
                 self._adhoc_units.add(name)
 
             # 选中并触发加载（空单元仅显示总览/空表）
-            items = self.unit_list.findItems(name, QtCore.Qt.MatchExactly)
-            if items:
-                self.unit_list.setCurrentItem(items[0])
-                self.on_unit_clicked(items[0])
+            self.unit_list.setCurrentItem(it)
+            self.on_unit_clicked(it)
 
             QtWidgets.QMessageBox.information(self, "已设置", "已填入单元名，请继续添加词条。")
 
@@ -3344,19 +3637,9 @@ class MainWindow(QtWidgets.QMainWindow):
         except Exception:
             pass
 
-        # 若假名/汉字的 QCompleter 下拉正在显示，同样不要回填
-        try:
-            c = self.add_term.completer()
-            if c and c.popup() and c.popup().isVisible():
-                return
-        except Exception:
-            pass
-        try:
-            c2 = self.add_kanji.completer()
-            if c2 and c2.popup() and c2.popup().isVisible():
-                return
-        except Exception:
-            pass
+        # 若假名/汉字的 QCompleter 下拉正在显示，同样不要回填（状态由 eventFilter 维护）
+        if self._term_completer_visible or self._kanji_completer_visible:
+            return
 
         if hasattr(self, "_mean_timer") and self._mean_timer:
             self._mean_timer.stop()
@@ -3369,12 +3652,15 @@ class MainWindow(QtWidgets.QMainWindow):
             return
 
         # 仅对“只有假名、且无汉字”的词条自动转罗马音
-        if not (_has_kana(term) and not _has_kanji(term)):
+        has_kana, has_kanji = _classify_jp(term)
+        if not has_kana or has_kanji:
             return
 
-        romaji = kana_to_romaji(term).strip()
+        romaji = _romaji_cached(term).strip()
         cur = (self.add_kana.text() or "").strip()
         last = getattr(self, "_last_auto_romaji", "")
+        if cur == romaji:
+            return  # 已是最新结果，不必重写输入框
 
         # 允许自动覆盖的条件：
         # 1) 未被用户自定义（_kana_autofilled 为 True）
@@ -3397,13 +3683,7 @@ class MainWindow(QtWidgets.QMainWindow):
     # --- 2) 在 MainWindow 内替换 _auto_fill_meaning_from_term，并新增 _is_japanese_like ---
     # 放到 class MainWindow 中（__init__ 外部），保持现有 self._mean_timer 绑定不变
     def _is_japanese_like(self, s: str) -> bool:
-        if not s:
-            return False
-        for ch in s:
-            code = ord(ch)
-            if (0x3040 <= code <= 0x30FF) or (0x31F0 <= code <= 0x31FF) or (0x4E00 <= code <= 0x9FFF):
-                return True
-        return False
+        return bool(s) and _JP_RE.search(s) is not None
 
     # 替换位置：class MainWindow 方法 _auto_fill_meaning_from_term
     def _auto_fill_meaning_from_term(self, force: bool = False):
@@ -3414,6 +3694,10 @@ class MainWindow(QtWidgets.QMainWindow):
         term = (self.add_term.text() or "").strip()
         kanji = (self.add_kanji.text() or "").strip()
 
+        # 定时器反复触发但 (汉字, 假名) 没变：上次已经查过/填过，直接返回（按回车的强制回填除外）
+        if not force and (kanji, term) == getattr(self, "_last_autofill_key", None):
+            return
+
         raw_keys = []
         if kanji: raw_keys.append(kanji)
         if term and term not in raw_keys: raw_keys.append(term)
@@ -3424,11 +3708,13 @@ class MainWindow(QtWidgets.QMainWindow):
         hit = None
         hit_key = ""
         for k in keys:
-            e = suggest_full_entry(k)  # (e_term, e_kana, e_mean)
+            e = _suggest_full_cached(k)  # (e_term, e_kana, e_mean)
             if e:
                 hit = e
                 hit_key = k
                 break
+        # 真正查过词典才记下这组输入（命中与否都算）
+        self._last_autofill_key = (kanji, term)
         if not hit:
             print(f"[AutoFill] 未命中: {keys}")
             return
@@ -3437,7 +3723,7 @@ class MainWindow(QtWidgets.QMainWindow):
         filled = []
 
         # 填“汉字写法”：当命中项 term 含汉字时
-        if e_term and any(0x4E00 <= ord(c) <= 0x9FFF for c in e_term):
+        if e_term and _HAN_RE.search(e_term):
             cur = (self.add_kanji.text() or "").strip()
             if force or not cur or getattr(self, "_kanji_autofilled", True):
                 if not cur or cur != e_term:
@@ -3463,12 +3749,35 @@ class MainWindow(QtWidgets.QMainWindow):
                     self._meaning_autofilled = True
                     filled.append("meaning")
 
+        # 回填会改动输入框，按回填后的内容记录，避免下一次定时器再走一遍
+        self._last_autofill_key = ((self.add_kanji.text() or "").strip(), (self.add_term.text() or "").strip())
+
         if filled:
             print(f"[AutoFill] 命中: {hit_key} -> {', '.join(filled)}")
         else:
             print(f"[AutoFill] 命中但未覆盖（均视为手动输入）：{hit_key}")
 
     # ---------- 选择单元查看词条 ----------
+    def _get_rows(self, unit):
+        """
+        取某单元的卡片行（unit=None 表示“所有单元”）。
+        结果按单元缓存，来回切换单元时不再重复查库；增删改后须调用 _invalidate_rows。
+        """
+        rows = self._rows_cache.get(unit)
+        if rows is None:
+            rows = list_cards_by_unit(self.db, unit)
+            self._rows_cache[unit] = rows
+        return rows[:]
+
+    def _invalidate_rows(self, *units):
+        """行缓存失效：不带参数则全部清空；否则清掉指定单元以及“所有单元”。"""
+        if not units:
+            self._rows_cache.clear()
+            return
+        for u in units:
+            self._rows_cache.pop(u, None)
+        self._rows_cache.pop(None, None)
+
     def on_unit_clicked(self, item):
         # 若切换单元，先收起释义候选弹窗
         try:
@@ -3479,130 +3788,80 @@ class MainWindow(QtWidgets.QMainWindow):
 
         unit = item.text()
         if unit == "所有单元":
-            rows = list_cards_by_unit(self.db, None)
+            rows = self._get_rows(None)
             self._current_unit = None
         else:
-            rows = list_cards_by_unit(self.db, unit)
+            rows = self._get_rows(unit)
             self._current_unit = unit
 
-        # 不再显示/计算总览条
-        self.overview.hide()
-
         # 缓存与刷新
         self._current_rows_all = rows[:]
         self._shuffled = False
+        self._shuffle_rank = None
 
-        # 清空搜索时临时屏蔽 textChanged，避免二次刷新
-        from PyQt5 import QtCore
-        with QtCore.QSignalBlocker(self.search_box):
-            self.search_box.clear()
-        with QtCore.QSignalBlocker(self.sort_combo):
-            self.sort_combo.setCurrentIndex(0)
-
-        # 把刷新放到事件队列，避免和上面的 UI 变更“同拍”触发重算
-        QtCore.QTimer.singleShot(0, self._apply_filters_and_refresh)
-
-        self.center_hint.setText(f"当前单元：{unit}（共 {len(rows)} 条）")
-
-        self.unit_table.show()
-        # 同步右侧“当前单元”标签
+        # 下面几处界面变更合并成一帧重绘；表格数据由 _schedule_refresh 在下一拍统一写入
+        cw = self.centralWidget()
+        cw.setUpdatesEnabled(False)
         try:
-            if hasattr(self, "lbl_current_unit") and self.lbl_current_unit:
-                self.lbl_current_unit.setText(unit if unit else "（请在左侧选择单元）")
-        except Exception:
-            pass
-
-    def _rebuild_op_column(self):
-        """
-        为“操作”列（第 5 列，0 基）放置三个图标按钮：发音 / 编辑 / 删除。
-        使用 setIndexWidget，按钮纯图标，无文字，更省空间。
-        """
-        view = self.unit_table
-        model = self._card_model
-        proxy = self._proxy
-
-        rows = model.rowCount()
-        for r in range(rows):
-            # 获取操作列的索引
-            src_idx = model.index(r, 5)
-            idx = proxy.mapFromSource(src_idx)
-            if not idx.isValid():
-                continue
-
-            cid = model.card_id_at(r)
+            # 不再显示/计算总览条
+            self.overview.hide()
 
-            # === 新增：获取假名数据用于发音 ===
-            # 第1列是假名列
-            idx_term = model.index(r, 1)
-            term_text = model.data(idx_term, QtCore.Qt.DisplayRole)
+            # 清空搜索时临时屏蔽 textChanged，避免二次刷新
+            with QtCore.QSignalBlocker(self.search_box):
+                self.search_box.clear()
+            with QtCore.QSignalBlocker(self.sort_combo):
+                self.sort_combo.setCurrentIndex(0)
 
-            cell = QtWidgets.QWidget()
-            h = QtWidgets.QHBoxLayout(cell)
-            h.setContentsMargins(4, 0, 4, 0)  # 左右边距 4
-            h.setSpacing(4)  # 按钮间距调小一点，容纳三个按钮
+            self.center_hint.setText(f"当前单元：{unit}（共 {len(rows)} 条）")
 
-            # 1. 喇叭按钮 (新增)
-            btn_speak = QtWidgets.QToolButton(cell)
-            speak_icon = self.style().standardIcon(QtWidgets.QStyle.SP_MediaPlay)
-            if speak_icon.isNull():
-                btn_speak.setText("🔊")
-            else:
-                btn_speak.setIcon(speak_icon)
-            btn_speak.setAutoRaise(True)
-            btn_speak.setIconSize(QtCore.QSize(16, 16))
-            btn_speak.setFixedSize(24, 24)
-            btn_speak.setToolTip("发音")
-            # 使用 lambda 捕获当前行的文本
-            btn_speak.clicked.connect(lambda _, t=term_text: self.speak_text(t))
-
-            # 2. 编辑按钮
-            btn_edit = QtWidgets.QToolButton(cell)
-            btn_edit.setAutoRaise(True)
-            edit_icon = QtGui.QIcon.fromTheme("document-edit")
-            if edit_icon.isNull():
-                btn_edit.setText("✎")
-            else:
-                btn_edit.setIcon(edit_icon)
-            btn_edit.setIconSize(QtCore.QSize(16, 16))
-            btn_edit.setFixedSize(24, 24)
-            btn_edit.setToolTip("编辑")
-            btn_edit.clicked.connect(lambda _, x=cid: self._edit_card_by_id(x))
-
-            # 3. 删除按钮
-            btn_del = QtWidgets.QToolButton(cell)
-            btn_del.setAutoRaise(True)
-            del_icon = self.style().standardIcon(QtWidgets.QStyle.SP_TrashIcon)
-            if del_icon.isNull():
-                btn_del.setText("🗑")
-            else:
-                btn_del.setIcon(del_icon)
-            btn_del.setIconSize(QtCore.QSize(16, 16))
-            btn_del.setFixedSize(24, 24)
-            btn_del.setToolTip("删除")
-            btn_del.clicked.connect(lambda _, x=cid: self._delete_card_by_id(x))
+            self.unit_table.show()
+            # 同步右侧“当前单元”标签
+            try:
+                if hasattr(self, "lbl_current_unit") and self.lbl_current_unit:
+                    self.lbl_current_unit.setText(unit if unit else "（请在左侧选择单元）")
+            except Exception:
+                pass
+        finally:
+            cw.setUpdatesEnabled(True)
 
-            h.addWidget(btn_speak)
-            h.addWidget(btn_edit)
-            h.addWidget(btn_del)
-            self.unit_table.setIndexWidget(idx, cell)
+        # 把刷新放到事件队列，避免和上面的 UI 变更“同拍”触发重算
+        self._schedule_refresh()
 
     def populate_unit_table(self, rows):
         """
         M3 实现：把 rows 设置进 model，并尽量保留滚动位置、选中项与排序。
         rows 是 list(tuple)，与你现有 DB 查询返回的一致。
         """
+        view = self.unit_table
+        # 表格当前不可见：只记下最新的行，等 Show 事件时再写入（多次刷新只做最后一次）
+        if not view.isVisible():
+            self._pending_rows = rows
+            return
+        self._pending_rows = None
+
         # 记住状态
         state = self._remember_table_state()
 
-        # 写入模型
-        self._card_model.set_rows(rows)
-
-        # 恢复状态
-        self._restore_table_state(state)
-        # 显示“当前单元：xxx（共 N 条）”的信息，你已有调用处会设置，这里不重复
+        # 批量写入期间暂停重绘与视图排序，整表只在结束时重排/重绘一次
+        was_sorting = view.isSortingEnabled()
+        view.setUpdatesEnabled(False)
+        view.setSortingEnabled(False)
+        # 按内容定宽的列先固定住，写入/恢复状态期间不反复量字宽，结束时再统一量一次
+        header = view.horizontalHeader()
+        for c in self._AUTO_WIDTH_COLS:
+            header.setSectionResizeMode(c, QtWidgets.QHeaderView.Fixed)
+        try:
+            # 写入模型（set_rows 内部是一次 reset，而不是逐格发信号）
+            self._card_model.set_rows(rows)
 
-        # 刷新“操作”列里的按钮（每次数据重置后都重建一次）
-        self._rebuild_op_column()
+            # 恢复状态
+            self._restore_table_state(state)
+            # 显示“当前单元：xxx（共 N 条）”的信息，你已有调用处会设置，这里不重复
+        finally:
+            for c in self._AUTO_WIDTH_COLS:
+                header.setSectionResizeMode(c, QtWidgets.QHeaderView.ResizeToContents)
+            view.setSortingEnabled(was_sorting)
+            view.setUpdatesEnabled(True)
 
     def _remember_table_state(self):
         """保存：滚动条位置、当前选中 card_id、排序列/序。"""
@@ -3639,10 +3898,7 @@ class MainWindow(QtWidgets.QMainWindow):
         # 恢复选中/滚动（保持原逻辑）
         target_row = -1
         if state.get("sel_id") is not None:
-            for r in range(self._card_model.rowCount()):
-                if self._card_model.card_id_at(r) == state["sel_id"]:
-                    target_row = r
-                    break
+            target_row = self._card_model.row_for_id(state["sel_id"])
         if target_row >= 0:
             src_idx = self._card_model.index(target_row, 0)
             proxy_idx = self._proxy.mapFromSource(src_idx)
@@ -3661,9 +3917,9 @@ class MainWindow(QtWidgets.QMainWindow):
         jp_kana = (self.add_kana.text() or "").strip() or None
 
         # 2) 兜底：若词条为纯假名且读音未填，则自动带入罗马音
-        if (not jp_kana) and _has_kana(term) and not _has_kanji(term):
+        if (not jp_kana) and _classify_jp(term) == (True, False):
             try:
-                jp_kana = kana_to_romaji(term)
+                jp_kana = _romaji_cached(term)
             except Exception:
                 pass
 
@@ -3687,6 +3943,7 @@ class MainWindow(QtWidgets.QMainWindow):
         # 使用左侧当前单元作为归属
         unit = unit_name
         add_card(self.db, language, unit, term, meaning, jp_kanji=jp_kanji, jp_kana=jp_kana)
+        self._invalidate_rows(unit)
 
         # 4) 清空与刷新
         # 4) 清空填写项，但保留单元选择与当前表格视图
@@ -3695,28 +3952,26 @@ class MainWindow(QtWidgets.QMainWindow):
         self.add_kanji.clear()
         self.add_kana.clear()
         self._kana_autofilled = True
+        self._last_autofill_key = None  # 表单已清空，再输入同一词时要重新回填
 
         # 更新“单元”下拉候选，但保留当前编辑文本
         self.refresh_units_to_combo()
 
         # 如新单元尚未出现在左侧列表，则追加（不改变当前选择）
-        if unit and all(self.unit_list.item(i).text() != unit for i in range(self.unit_list.count())):
-            self.unit_list.addItem(unit)
+        if unit and self._unit_item(unit) is None:
+            self._add_unit_item(unit)
 
         # 刷新当前视图：按左侧当前选中的单元重载数据，但不重置搜索/排序/打乱
         cur_item = self.unit_list.currentItem()
         if cur_item:
             cur = cur_item.text()
-            if cur == "所有单元":
-                rows = list_cards_by_unit(self.db, None)
-            else:
-                rows = list_cards_by_unit(self.db, cur)
+            rows = self._get_rows(None if cur == "所有单元" else cur)
 
             # 不再显示/计算总览条
             self.overview.hide()
 
             self._current_rows_all = rows[:]  # 保持“原始行”
-            self._apply_filters_and_refresh()  # 走你已有的搜索/排序/打乱
+            self._schedule_refresh()  # 走你已有的搜索/排序/打乱（合并到下一拍统一刷新）
             self.center_hint.setText(f"当前单元：{cur}（共 {len(rows)} 条）")
 
         # 让焦点回到“假名”输入，便于继续录入
@@ -3734,9 +3989,13 @@ class MainWindow(QtWidgets.QMainWindow):
     def closeEvent(self, e: QtGui.QCloseEvent):
         try:
             rh = self.unit_table.verticalHeader().defaultSectionSize()
-            self.settings.set("table_row_height", int(rh))
-            self.settings.set("op_col_width", int(self.unit_table.columnWidth(5)))
-            self.settings.save()
+            ow = self.unit_table.columnWidth(5)
+            # 与已缓存的设置相同就不必重写设置文件
+            if (rh, ow) != (self._s_row_h, self._s_op_w):
+                self.settings.set("table_row_height", rh)
+                self.settings.set("op_col_width", ow)
+                self.settings.save()
+                self._s_row_h, self._s_op_w = rh, ow
         except Exception:
             pass
         super().closeEvent(e)
@@ -3750,6 +4009,7 @@ class MainWindow(QtWidgets.QMainWindow):
         if reply == QtWidgets.QMessageBox.Yes:
             # 删除真实 DB 记录
             delete_card(self.db, int(cid))
+            self._invalidate_rows()
             # 保持当前单元视图并刷新，以“行号”重新编号
             cur_item = self.unit_list.currentItem()
             if cur_item:
@@ -3776,6 +4036,7 @@ class MainWindow(QtWidgets.QMainWindow):
                 update_card_fields_full(
                     self.db, row[0], language, unit, term, meaning, jp_kanji, jp_kana, jp_ruby
                 )
+                self._invalidate_rows(row[2], unit)  # 原单元与新单元都可能变化
             except Exception as e:
                 QtWidgets.QMessageBox.critical(self, "保存失败", f"写入数据库失败：{e}")
                 return
@@ -3784,11 +4045,9 @@ class MainWindow(QtWidgets.QMainWindow):
             cur_item = self.unit_list.currentItem()
             cur_unit = cur_item.text() if cur_item else "所有单元"
             try:
-                if cur_unit == "所有单元":
-                    rows = list_cards_by_unit(self.db, None)
-                else:
-                    rows = list_cards_by_unit(self.db, cur_unit)
-                self.populate_unit_table(rows)
+                rows = self._get_rows(None if cur_unit == "所有单元" else cur_unit)
+                self._current_rows_all = rows[:]
+                self._schedule_refresh()
                 self.center_hint.setText(f"当前单元：{cur_unit}（共 {len(rows)} 条）")
             except Exception:
                 self.refresh_units()
@@ -3801,6 +4060,7 @@ class MainWindow(QtWidgets.QMainWindow):
         if reply != QtWidgets.QMessageBox.Yes:
             return
         delete_card(self.db, int(card_id))
+        self._invalidate_rows()
         cur_item = self.unit_list.currentItem()
         if cur_item:
             self.on_unit_clicked(cur_item)
@@ -3825,6 +4085,7 @@ class MainWindow(QtWidgets.QMainWindow):
                 update_card_fields_full(
                     self.db, row[0], language, unit, term, meaning, jp_kanji, jp_kana, jp_ruby
                 )
+                self._invalidate_rows(row[2], unit)  # 原单元与新单元都可能变化
             except Exception as e:
                 QtWidgets.QMessageBox.critical(self, "保存失败", f"写入数据库失败：{e}")
                 return
@@ -3833,11 +4094,9 @@ class MainWindow(QtWidgets.QMainWindow):
             cur_item = self.unit_list.currentItem()
             cur_unit = cur_item.text() if cur_item else "所有单元"
             try:
-                if cur_unit == "所有单元":
-                    rows = list_cards_by_unit(self.db, None)
-                else:
-                    rows = list_cards_by_unit(self.db, cur_unit)
-                self.populate_unit_table(rows)
+                rows = self._get_rows(None if cur_unit == "所有单元" else cur_unit)
+                self._current_rows_all = rows[:]
+                self._schedule_refresh()
                 self.center_hint.setText(f"当前单元：{cur_unit}（共 {len(rows)} 条）")
             except Exception:
                 # 保底刷新
@@ -3897,31 +4156,45 @@ class MainWindow(QtWidgets.QMainWindow):
             for k, v in vals.items():
                 self.settings.set(k, v)
             self.settings.save()
+            self._cache_typed_settings()
             self.apply_settings()
 
+    def _cache_typed_settings(self):
+        """把界面常用的设置项转换成确定类型后缓存（载入/保存设置后调用），apply_settings/closeEvent 直接读。"""
+        def _num(key, cast, default):
+            try:
+                return cast(self.settings.get(key, default))
+            except Exception:
+                return default
+
+        self._s_row_h = _num("table_row_height", int, 28)
+        self._s_op_w = _num("op_col_width", int, 84)
+        self._s_font_scale = _num("font_scale", float, 1.0) or 1.0
+
     def apply_settings(self):
-        """把设置写回到当前 UI（行高/操作列宽/字号/词典等），并重建操作列按钮。"""
-        # 表格尺寸
+        """把设置写回到当前 UI（行高/操作列宽/字号/词典等）。"""
+        # 表格尺寸（值没变就不动，避免无谓的重新布局）
         try:
-            self.unit_table.verticalHeader().setDefaultSectionSize(
-                int(self.settings.get("table_row_height", 28))
-            )
-            self.unit_table.setColumnWidth(
-                5, int(self.settings.get("op_col_width", 84))
-            )
+            vh = self.unit_table.verticalHeader()
+            if vh.defaultSectionSize() != self._s_row_h:
+                vh.setDefaultSectionSize(self._s_row_h)
+            if self.unit_table.columnWidth(5) != self._s_op_w:
+                self.unit_table.setColumnWidth(5, self._s_op_w)
         except Exception:
             pass
 
         # 字号缩放（温和处理）——仅作用在主界面的 centralWidget，避免影响外部顶级窗口（例如 KanaQuiz）
+        # setStyleSheet 会让所有子控件重新 polish，字号没变时跳过
         try:
-            fs = float(self.settings.get("font_scale", 1.0) or 1.0)
+            fs = self._s_font_scale
             base_px = 12
             cw = self.centralWidget()
-            if cw is not None:
+            if cw is not None and fs != getattr(self, "_last_style_fs", None):
                 cw.setObjectName("vocabRoot")
                 cw.setStyleSheet(
                     f"#vocabRoot, #vocabRoot * {{ font-size: {int(base_px * fs)}px; }}"
                 )
+                self._last_style_fs = fs
         except Exception:
             pass
 
@@ -3934,12 +4207,8 @@ class MainWindow(QtWidgets.QMainWindow):
                 _LOCAL_DICT.load(None)  # 回到默认
         except Exception:
             pass
-
-        # 操作列按钮在列宽改变后重建一次，避免被挤压
-        try:
-            self._rebuild_op_column()
-        except Exception:
-            pass
+        _clear_dict_caches()  # 词典可能已更换，清掉联想缓存
+        self._last_autofill_key = None  # 同一输入也要用新词典重查
 
     def open_stats_dialog(self):
         dlg = StatsDialog(self, self.db, use_mpl=False)  # ← 强制安全模式（纯文本/表格），不触发 Qt5Agg
@@ -3994,12 +4263,9 @@ class MainWindow(QtWidgets.QMainWindow):
         if not kana:
             return
         # 避免触发“这是用户手改”的标记
-        try:
-            self.add_term.blockSignals(True)
+        with QtCore.QSignalBlocker(self.add_term):
             self.add_term.setText(kana)
             self._term_autofilled = True
-        finally:
-            self.add_term.blockSignals(False)
 
         try:
             if getattr(self, "_kana_popup", None):
@@ -4061,17 +4327,23 @@ class MainWindow(QtWidgets.QMainWindow):
                 c.popup().hide()
         except Exception:
             pass
+        # 同一候选再次确认（如重复回车）：两个框都已是上次写入的结果，跳过重写与罗马音反推
+        if (kana == getattr(self, "_last_kana_committed", None)
+                and (self.add_term.text() or "").strip() == kana
+                and (self.add_kana.text() or "").strip() == getattr(self, "_last_auto_romaji", None)):
+            try:
+                self.add_mean.setFocus()
+            except Exception:
+                pass
+            return
         # 2) 回填“假名”，期间阻断信号，避免触发 completer
-        try:
-            self.add_term.blockSignals(True)
+        with QtCore.QSignalBlocker(self.add_term):
             self.add_term.setText(kana)
             self._term_autofilled = True
-        finally:
-            self.add_term.blockSignals(False)
 
         # 3) 若“罗马音(可选)”为空或仍处于自动填状态，则按假名反推罗马音
         try:
-            roma = kana_to_romaji(kana)  # 你工程已有此函数
+            roma = _romaji_cached(kana)  # 反复点选同一候选时直接命中缓存
             cur = (self.add_kana.text() or "").strip()
             if getattr(self, "_kana_autofilled", True) or (not cur):
                 self._auto_kana_in_progress = True
@@ -4083,6 +4355,7 @@ class MainWindow(QtWidgets.QMainWindow):
                     self._auto_kana_in_progress = False
         except Exception:
             pass
+        self._last_kana_committed = kana
 
         # 4) 方便继续操作：把光标放回中文释义或“添加”按钮（按你的习惯也可放回“假名”）
         try:
@@ -4105,6 +4378,48 @@ class MainWindow(QtWidgets.QMainWindow):
                 pass
 
 class KanaQuiz(QtWidgets.QWidget):
+    # 全角 ASCII（输入法没切回半角时的 ｋａ 之类）→ 半角；translate 一次 C 级遍历完成
+    _FW_TABLE = {0xFF01 + i: 0x21 + i for i in range(94)}
+    _FW_TABLE[0x3000] = 0x20
+
+    # 题库与别名：类级常量，导入时建一次，各实例共享（不要原地修改）
+    # 键值统一驻留：出题池与判题用同一批字符串对象，user == correct_key 可直接命中指针相等
+    HIRA_MAP = {sys.intern(k): sys.intern(v) for k, v in {
+        'a':'あ','i':'い','u':'う','e':'え','o':'お',
+        'ka':'か','ki':'き','ku':'く','ke':'け','ko':'こ',
+        'sa':'さ','shi':'し','su':'す','se':'せ','so':'そ',
+        'ta':'た','chi':'ち','tsu':'つ','te':'て','to':'と',
+        'na':'な','ni':'に','nu':'ぬ','ne':'ね','no':'の',
+        'ha':'は','hi':'ひ','fu':'ふ','he':'へ','ho':'ほ',
+        'ma':'ま','mi':'み','mu':'む','me':'め','mo':'も',
+        'ya':'や','yu':'ゆ','yo':'よ',
+        'ra':'ら','ri':'り','ru':'る','re':'れ','ro':'ろ',
+        'wa':'わ','wo':'を','n':'ん'
+    }.items()}
+    KATA_MAP = {sys.intern(k): sys.intern(v) for k, v in {
+        'a':'ア','i':'イ','u':'ウ','e':'エ','o':'オ',
+        'ka':'カ','ki':'キ','ku':'ク','ke':'ケ','ko':'コ',
+        'sa':'サ','shi':'シ','su':'ス','se':'セ','so':'ソ',
+        'ta':'タ','chi':'チ','tsu':'ツ','te':'テ','to':'ト',
+        'na':'ナ','ni':'ニ','nu':'ヌ','ne':'ネ','no':'ノ',
+        'ha':'ハ','hi':'ヒ','fu':'フ','he':'ヘ','ho':'ホ',
+        'ma':'マ','mi':'ミ','mu':'ム','me':'メ','mo':'モ',
+        'ya':'ヤ','yu':'ユ','yo':'ヨ',
+        'ra':'ラ','ri':'リ','ru':'ル','re':'レ','ro':'ロ',
+        'wa':'ワ','wo':'ヲ','n':'ン'
+    }.items()}
+    # 别名映射
+    ALIAS_MAP = {sys.intern(k): sys.intern(v) for k, v in {
+        'hu': 'fu', 'si': 'shi', 'zi': 'ji', 'ti': 'chi', 'tu': 'tsu',
+        'jya': 'ja', 'jyu': 'ju', 'jyo': 'jo', 'nn': 'n', 'c': 'ku',
+        'la': 'ra', 'li': 'ri', 'lu': 'ru', 'le': 're', 'lo': 'ro',
+    }.items()}
+    # 出题池：按“是否平假名”预先展开成元组，出题时不再每次 list(items())
+    _POOLS = {
+        True: tuple(HIRA_MAP.items()),
+        False: tuple(KATA_MAP.items()),
+    }
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("平假名/片假名 测验")
@@ -4135,7 +4450,12 @@ class KanaQuiz(QtWidgets.QWidget):
         self.btn_hira = QtWidgets.QRadioButton("平假名 -> 罗马音")
         self.btn_kata = QtWidgets.QRadioButton("片假名 -> 罗马音")
         self.btn_hira.setChecked(True)
-        self.btn_hira.toggled.connect(self.reset_quiz)
+        # 两个单选放进同一组；只在“被选中”的那一次重置，忽略另一个按钮的取消选中
+        self._mode_group = QtWidgets.QButtonGroup(self)
+        self._mode_group.addButton(self.btn_hira)
+        self._mode_group.addButton(self.btn_kata)
+        self._mode_group.buttonToggled.connect(
+            lambda _btn, checked: checked and self.reset_quiz())
 
         font = QtGui.QFont()
         font.setPointSize(12)
@@ -4182,42 +4502,18 @@ class KanaQuiz(QtWidgets.QWidget):
         self.lbl_score.setStyleSheet("font-size: 16px; color: #374151; margin-top: 10px;")
         layout.addWidget(self.lbl_score)
 
-        # 数据
-        self.hira_map = {
-            'a':'あ','i':'い','u':'う','e':'え','o':'お',
-            'ka':'か','ki':'き','ku':'く','ke':'け','ko':'こ',
-            'sa':'さ','shi':'し','su':'す','se':'せ','so':'そ',
-            'ta':'た','chi':'ち','tsu':'つ','te':'て','to':'と',
-            'na':'な','ni':'に','nu':'ぬ','ne':'ね','no':'の',
-            'ha':'は','hi':'ひ','fu':'ふ','he':'へ','ho':'ほ',
-            'ma':'ま','mi':'み','mu':'む','me':'め','mo':'も',
-            'ya':'や','yu':'ゆ','yo':'よ',
-            'ra':'ら','ri':'り','ru':'る','re':'れ','ro':'ろ',
-            'wa':'わ','wo':'を','n':'ん'
-        }
-        self.kata_map = {
-            'a':'ア','i':'イ','u':'ウ','e':'エ','o':'オ',
-            'ka':'カ','ki':'キ','ku':'ク','ke':'ケ','ko':'コ',
-            'sa':'サ','shi':'シ','su':'ス','se':'セ','so':'ソ',
-            'ta':'タ','chi':'チ','tsu':'ツ','te':'テ','to':'ト',
-            'na':'ナ','ni':'ニ','nu':'ヌ','ne':'ネ','no':'ノ',
-            'ha':'ハ','hi':'ヒ','fu':'フ','he':'ヘ','ho':'ホ',
-            'ma':'マ','mi':'ミ','mu':'ム','me':'メ','mo':'モ',
-            'ya':'ヤ','yu':'ユ','yo':'ヨ',
-            'ra':'ラ','ri':'リ','ru':'ル','re':'レ','ro':'ロ',
-            'wa':'ワ','wo':'ヲ','n':'ン'
-        }
-
-        # 别名映射
-        self.alias_map = {
-            'hu': 'fu', 'si': 'shi', 'zi': 'ji', 'ti': 'chi', 'tu': 'tsu',
-            'jya': 'ja', 'jyu': 'ju', 'jyo': 'jo', 'nn': 'n', 'c': 'ku',
-            'la': 'ra', 'li': 'ri', 'lu': 'ru', 'le': 're', 'lo': 'ro',
-        }
-
         self.current_q = None
         self.is_waiting_next = False # 防止连击（正确时）
         self.showing_error = False   # === 关键新增：是否正在显示错误 ===
+        # 答对后的自动跳题：单个可取消的计时器，换模式/手动下一题时停掉，避免再多出一题
+        self._next_timer = QtCore.QTimer(self); self._next_timer.setSingleShot(True)
+        self._next_timer.setInterval(1000)
+        self._next_timer.timeout.connect(self.next_question)
+        # 出题权重：与 _POOLS 下标对齐，权重 = 1 + 错题计数；答错 +1，答对衰减为 0.9 倍
+        self._miss = {m: [0.0] * len(p) for m, p in self._POOLS.items()}
+        self._weights = {m: [1.0] * len(p) for m, p in self._POOLS.items()}
+        self._q_mode = True
+        self._q_idx = 0
         self.reset_quiz()
 
     def reset_quiz(self):
@@ -4229,26 +4525,46 @@ class KanaQuiz(QtWidgets.QWidget):
 
     def next_question(self):
         # === 重置所有状态 ===
+        self._next_timer.stop()
         self.is_waiting_next = False
         self.showing_error = False
 
         self.ed_input.clear()
-        self.ed_input.setProperty("state", "")
-        self.ed_input.style().unpolish(self.ed_input)
-        self.ed_input.style().polish(self.ed_input)
+        self._set_state("")
 
         self.lbl_result.setText("请输入罗马音")
         self.lbl_result.setStyleSheet("color: #6b7280;")
         self.btn_next.setText("跳过 / 下一题") # 恢复按钮文字
 
-        is_hira = self.btn_hira.isChecked()
-        pool = list(self.hira_map.items()) if is_hira else list(self.kata_map.items())
-        self.current_q = random.choice(pool)
+        # 按错题权重抽题：常错的假名出现得更频繁
+        mode = self.btn_hira.isChecked()
+        pool = self._POOLS[mode]
+        self._q_mode = mode
+        self._q_idx = random.choices(range(len(pool)), weights=self._weights[mode])[0]
+        self.current_q = pool[self._q_idx]
         self.lbl_char.setText(self.current_q[1])
 
+    def _update_weight(self, correct: bool):
+        """只改当前题对应的一项权重，不整表重算。"""
+        miss = self._miss[self._q_mode]
+        i = self._q_idx
+        miss[i] = miss[i] * 0.9 if correct else miss[i] + 1
+        self._weights[self._q_mode][i] = 1.0 + miss[i]
+
+    def _set_state(self, state: str):
+        """切换输入框的 state 属性（空/correct/wrong）；值没变就不重算样式。"""
+        w = self.ed_input
+        if w.property("state") == state:
+            return
+        w.setProperty("state", state)
+        # 属性选择器只需重新 polish 一次即可生效，不必先 unpolish
+        w.style().polish(w)
+        w.update()
+
     def normalize_input(self, text):
-        s = text.strip().lower()
-        return self.alias_map.get(s, s)
+        # 别名按整串匹配：'c'→'ku' 这类短别名若做子串替换会把 'chi' 改坏
+        s = text.translate(self._FW_TABLE).strip().lower()
+        return sys.intern(self.ALIAS_MAP.get(s, s))
 
     def check_answer(self):
         if not self.current_q: return
@@ -4266,6 +4582,7 @@ class KanaQuiz(QtWidgets.QWidget):
         correct_key = self.current_q[0]
 
         self.total += 1
+        self._update_weight(user == correct_key)
 
         if user == correct_key:
             # === 答对逻辑（保持不变） ===
@@ -4273,20 +4590,16 @@ class KanaQuiz(QtWidgets.QWidget):
             self.lbl_result.setText(f"✅ 正确！({correct_key})")
             self.lbl_result.setStyleSheet("color: #059669; font-weight: bold;")
 
-            self.ed_input.setProperty("state", "correct")
-            self.ed_input.style().unpolish(self.ed_input)
-            self.ed_input.style().polish(self.ed_input)
+            self._set_state("correct")
 
             self.is_waiting_next = True
-            QtCore.QTimer.singleShot(1000, self.next_question)
+            self._next_timer.start()
         else:
             # === 答错逻辑（修改） ===
             self.lbl_result.setText(f"❌ 错误，应该是: {correct_key} (按回车继续)")
             self.lbl_result.setStyleSheet("color: #dc2626; font-weight: bold;")
 
-            self.ed_input.setProperty("state", "wrong")
-            self.ed_input.style().unpolish(self.ed_input)
-            self.ed_input.style().polish(self.ed_input)
+            self._set_state("wrong")
 
             # 标记为“正在显示错误”，并更改按钮文字提示
             self.showing_error = True
@@ -4298,6 +4611,11 @@ class KanaQuiz(QtWidgets.QWidget):
         self.update_score()
 
     def update_score(self):
+        # 分数没变（例如重复的 reset）就不重设文本，省掉一次 QLabel 重排/重绘
+        new = (self.score, self.total)
+        if new == getattr(self, "_score_cache", None):
+            return
+        self._score_cache = new
         self.lbl_score.setText(f"得分: {self.score} / {self.total}")
 
 class SettingsDialog(QtWidgets.QDialog):
@@ -4381,6 +4699,89 @@ class SettingsDialog(QtWidgets.QDialog):
         }
 
 
+def _query_stats(conn) -> dict:
+    """
+    学习统计用到的全部聚合查询（只读）。
+    只依赖传入的连接，既可在 GUI 线程用主连接调用，也可在后台线程用独立连接调用。
+    """
+    cur = conn.cursor()
+    try:
+        cur.execute("PRAGMA temp_store=MEMORY")  # 后台线程的独立连接没有 init_db 的 PRAGMA
+    except Exception:
+        pass
+
+    # 1) 总卡片数 + EF & repetition：一次扫描 cards 拿齐（原先 COUNT 与两次列查询共三趟）
+    total_cards = 0
+    ef_list = []
+    rep_list = []
+    for ef, repetition in cur.execute("SELECT ef, repetition FROM cards"):
+        total_cards += 1
+        if ef is not None:
+            ef_list.append(float(ef))
+        if repetition is not None:
+            rep_list.append(int(repetition))
+
+    # 2) 单元分布
+    per_unit = cur.execute(
+        "SELECT unit, COUNT(*) AS c FROM cards GROUP BY unit ORDER BY c DESC LIMIT 10"
+    ).fetchall()
+
+    # 3) 最近新增（近 60 天）
+    new_per_day = cur.execute(
+        "SELECT substr(created_at,1,10) AS d, COUNT(*) "
+        "FROM cards WHERE created_at IS NOT NULL "
+        "GROUP BY d ORDER BY d DESC LIMIT 60"
+    ).fetchall()
+    new_per_day = list(reversed(new_per_day))  # 升序画线
+
+    # 4) 复习活动（近 90 天）
+    # 直接比较 ts（ISO8601 字符串，字典序即时间序），可走 idx_reviews_ts 范围查找；
+    # 包一层 substr() 则只能全表扫描
+    reviews_per_day = cur.execute(
+        "SELECT substr(ts,1,10) AS d, COUNT(*) AS n, "
+        "SUM(CASE WHEN quality>=4 THEN 1 ELSE 0 END) AS cor "
+        "FROM reviews "
+        "WHERE ts >= date('now','-90 day') "
+        "GROUP BY d ORDER BY d DESC"
+    ).fetchall()
+    reviews_per_day = list(reversed(reviews_per_day))  # 升序画线
+
+    return {
+        "total_cards": total_cards,
+        "per_unit": per_unit,
+        "new_per_day": new_per_day,
+        "reviews_per_day": reviews_per_day,
+        "ef_list": ef_list,
+        "rep_list": rep_list,
+        "due_forecast": [],
+    }
+
+
+class _StatsSignals(QtCore.QObject):
+    done = QtCore.pyqtSignal(object)  # dict；失败时为 None
+
+
+class _StatsWorker(QtCore.QRunnable):
+    """在线程池里跑 _query_stats。sqlite 连接不能跨线程共用，这里按路径另开一个。"""
+
+    def __init__(self, db_path: str):
+        super().__init__()
+        self.db_path = db_path
+        self.signals = _StatsSignals()
+
+    def run(self):
+        data = None
+        try:
+            conn = sqlite3.connect(self.db_path)
+            try:
+                data = _query_stats(conn)
+            finally:
+                conn.close()
+        except Exception:
+            data = None
+        self.signals.done.emit(data)
+
+
 class StatsDialog(QtWidgets.QDialog):
     """
     学习统计与可视化：
@@ -4397,13 +4798,8 @@ class StatsDialog(QtWidgets.QDialog):
         self.use_mpl = bool(use_mpl and HAS_MPL)  # ← 新增：本对话框是否使用 matplotlib
         self.setWindowTitle("学习统计与可视化")
         self.setMinimumSize(880, 640)
-
-        # 确保 CJK 回退链就绪（只需调用一次也没问题）
-        if self.use_mpl:
-            try:
-                _init_mpl_cjk_fonts()
-            except Exception:
-                pass
+        # 画布占位：[(属性名, 所在布局)]；__init__ 只搭界面，画布在首次显示时创建
+        self._pending_canvases = []
 
         lay = QtWidgets.QVBoxLayout(self)
 
@@ -4435,17 +4831,25 @@ class StatsDialog(QtWidgets.QDialog):
         # self.tab_due = QtWidgets.QWidget(); self.tabs.addTab(self.tab_due, "排程")
         # self._build_due_tab()
 
-        # 加载数据（立即）
-        self._load_data()
+        # 空数据占位；真实数据由后台查询回填（见 _start_loading）
+        self.total_cards = 0
+        self.per_unit = []
+        self.new_per_day = []
+        self.reviews_per_day = []
+        self.ef_list = []
+        self.rep_list = []
+        self.due_forecast = []
+        self._data_ready = False
         # 延后到窗口显示后再渲染，避免 Qt5Agg 在未可见状态下 draw() 的偶发崩溃
         self._plotted = False
+        self._start_loading()
 
     # ---------- UI 构造（每个 tab） ----------
     def _build_overview_tab(self):
         l = QtWidgets.QVBoxLayout(self.tab_overview)
         if self.use_mpl:
-            self.fig_ov_unit = self._make_canvas(l, "各单元词数 Top10（柱状）")
-            self.fig_ov_new = self._make_canvas(l, "最近新增词条（按天，近60天）")
+            self._make_canvas(l, "各单元词数 Top10（柱状）", "fig_ov_unit")
+            self._make_canvas(l, "最近新增词条（按天，近60天）", "fig_ov_new")
         else:
             # Top10：各单元词数
             self.tbl_units = QtWidgets.QTableWidget(0, 2)
@@ -4474,8 +4878,8 @@ class StatsDialog(QtWidgets.QDialog):
     def _build_activity_tab(self):
         l = QtWidgets.QVBoxLayout(self.tab_activity)
         if self.use_mpl:
-            self.fig_act_cnt = self._make_canvas(l, "每日复习量（近90天）")
-            self.fig_act_acc = self._make_canvas(l, "每日正确率（近90天）")
+            self._make_canvas(l, "每日复习量（近90天）", "fig_act_cnt")
+            self._make_canvas(l, "每日正确率（近90天）", "fig_act_acc")
         else:
             self.tbl_act = QtWidgets.QTableWidget(0, 3)
             self.tbl_act.setHorizontalHeaderLabels(["日期", "复习数", "正确率%"])
@@ -4492,8 +4896,8 @@ class StatsDialog(QtWidgets.QDialog):
     def _build_quality_tab(self):
         l = QtWidgets.QVBoxLayout(self.tab_quality)
         if self.use_mpl:
-            self.fig_ef = self._make_canvas(l, "EF（易度）分布（直方图）")
-            self.fig_rep = self._make_canvas(l, "重复次数分布（直方图）")
+            self._make_canvas(l, "EF（易度）分布（直方图）", "fig_ef")
+            self._make_canvas(l, "重复次数分布（直方图）", "fig_rep")
         else:
             self.tbl_ef = QtWidgets.QTableWidget(0, 2)
             self.tbl_ef.setHorizontalHeaderLabels(["EF 区间", "数量"])
@@ -4520,17 +4924,23 @@ class StatsDialog(QtWidgets.QDialog):
             l.addWidget(QtWidgets.QLabel("重复次数分布"))
             l.addWidget(self.tbl_rep)
 
-    def _make_canvas(self, parent_layout, title: str):
+    def _make_canvas(self, parent_layout, title: str, attr: str):
+        """只放标题和占位布局；真正的 Figure/画布由 _create_canvases 在首次显示时补上。"""
         w = QtWidgets.QWidget()
         v = QtWidgets.QVBoxLayout(w);
         v.setContentsMargins(0, 0, 0, 0)
         lb = QtWidgets.QLabel(title);
         v.addWidget(lb)
-        fig = plt.figure()
-        canvas = FigureCanvas(fig)
-        v.addWidget(canvas, 1)
         parent_layout.addWidget(w, 1)
-        return canvas
+        self._pending_canvases.append((attr, v))
+
+    def _create_canvases(self):
+        # 用 matplotlib.figure.Figure 而非 plt.figure()：不进 pyplot 的全局图管理器，关窗即释放
+        for attr, v in self._pending_canvases:
+            canvas = FigureCanvas(Figure())
+            v.addWidget(canvas, 1)
+            setattr(self, attr, canvas)
+        self._pending_canvases = []
 
     def _get_cjk_fontprop(self):
         """
@@ -4575,63 +4985,55 @@ class StatsDialog(QtWidgets.QDialog):
 
     def showEvent(self, e):
         super().showEvent(e)
-        if not getattr(self, "_plotted", False):
+        if not getattr(self, "_plotted", False) and getattr(self, "_data_ready", False):
             try:
                 self._render_all()
             finally:
                 self._plotted = True
 
     # ---------- 数据查询 ----------
-    def _load_data(self):
-        self.total_cards = 0
-        self.per_unit = []  # [(unit, cnt)]
-        self.new_per_day = []  # [(day, cnt)]
-        self.reviews_per_day = []  # [(day, n, correct)]
-        self.ef_list = []  # [ef...]
-        self.rep_list = []  # [rep...]
-        self.due_forecast = []  # [(day, cnt)]
-
-        cur = self.db.cursor()
-
-        # 1) 总卡片数
-        row = cur.execute("SELECT COUNT(*) FROM cards").fetchone()
-        self.total_cards = int(row[0]) if row and row[0] is not None else 0
-
-        # 2) 单元分布
-        self.per_unit = cur.execute(
-            "SELECT unit, COUNT(*) AS c FROM cards GROUP BY unit ORDER BY c DESC LIMIT 10"
-        ).fetchall()
-
-        # 3) 最近新增（近 60 天）
-        self.new_per_day = cur.execute(
-            "SELECT substr(created_at,1,10) AS d, COUNT(*) "
-            "FROM cards WHERE created_at IS NOT NULL "
-            "GROUP BY d ORDER BY d DESC LIMIT 60"
-        ).fetchall()
-        self.new_per_day = list(reversed(self.new_per_day))  # 升序画线
-
-        # 4) 复习活动（近 90 天）
-        self.reviews_per_day = cur.execute(
-            "SELECT d, COUNT(*) AS n, "
-            "SUM(CASE WHEN quality>=4 THEN 1 ELSE 0 END) AS cor "
-            "FROM ("
-            "  SELECT substr(ts,1,10) AS d, quality "
-            "  FROM reviews "
-            "  WHERE substr(ts,1,10) >= date('now','-90 day')"
-            ") "
-            "GROUP BY d ORDER BY d DESC"
-        ).fetchall()
-        self.reviews_per_day = list(reversed(self.reviews_per_day))
-
-        self.reviews_per_day = list(reversed(self.reviews_per_day))
-
-        # 5) EF & repetition
-        self.ef_list = [float(x[0]) for x in cur.execute(
-            "SELECT ef FROM cards WHERE ef IS NOT NULL"
-        ).fetchall() if x[0] is not None]
-        self.rep_list = [int(x[0]) for x in cur.execute(
-            "SELECT repetition FROM cards WHERE repetition IS NOT NULL"
-        ).fetchall() if x[0] is not None]
+    def _db_file(self) -> str:
+        """当前连接对应的数据库文件路径；内存库/取不到时返回空串。"""
+        try:
+            for _, name, file in self.db.execute("PRAGMA database_list").fetchall():
+                if name == "main":
+                    return file or ""
+        except Exception:
+            pass
+        return ""
+
+    def _start_loading(self):
+        """后台线程用独立连接跑聚合查询；拿不到文件路径时退回同步查询。"""
+        path = self._db_file()
+        if not path:
+            self._load_data(_query_stats(self.db))
+            return
+        # 持有 worker 引用，保证 signals 对象活到结果回来
+        self._stats_worker = _StatsWorker(path)
+        self._stats_worker.signals.done.connect(self._on_stats_loaded)
+        QtCore.QThreadPool.globalInstance().start(self._stats_worker)
+
+    def _on_stats_loaded(self, data):
+        self._stats_worker = None
+        if data is None:
+            self.lbl_overview.setText("统计加载失败。")
+            return
+        self._load_data(data)
+        if self.isVisible() and not self._plotted:
+            try:
+                self._render_all()
+            finally:
+                self._plotted = True
+
+    def _load_data(self, data: dict):
+        self.total_cards = data["total_cards"]
+        self.per_unit = data["per_unit"]  # [(unit, cnt)]
+        self.new_per_day = data["new_per_day"]  # [(day, cnt)]
+        self.reviews_per_day = data["reviews_per_day"]  # [(day, n, correct)]
+        self.ef_list = data["ef_list"]  # [ef...]
+        self.rep_list = data["rep_list"]  # [rep...]
+        self.due_forecast = data["due_forecast"]  # [(day, cnt)]
+        self._data_ready = True
 
         # 顶部概要文本
         units_cnt = len(self.per_unit)
@@ -4648,7 +5050,17 @@ class StatsDialog(QtWidgets.QDialog):
 
     # ---------- 绘图 / 填充 ----------
     def _render_all(self):
+        if self.use_mpl and not _load_mpl():
+            # 安装了但导入失败：占位处给个提示即可
+            for _, v in self._pending_canvases:
+                v.addWidget(QtWidgets.QLabel("matplotlib 加载失败，无法绘图。"), 1)
+            self._pending_canvases = []
+            return
         if self.use_mpl:
+            self._create_canvases()
+            # 字体注册完成后取一次，三个 _plot_* 的所有坐标轴共用
+            self._cjk_fp = self._get_cjk_fontprop()
+            # 各 _plot_* 末尾用 draw_idle()：重绘并入下一轮事件循环，不在 showEvent 里同步渲染六张图
             self._plot_overview()
             self._plot_activity()
             self._plot_quality()
@@ -4666,9 +5078,9 @@ class StatsDialog(QtWidgets.QDialog):
         ax.set_xticklabels(labels, rotation=30, ha="right")
         ax.set_ylabel("词数")
         ax.set_title("各单元词数 Top10")
-        fp = self._get_cjk_fontprop()
+        fp = self._cjk_fp
         self._apply_axis_cjk(ax, fp)
-        self.fig_ov_unit.draw()
+        self.fig_ov_unit.draw_idle()
 
         # 最近新增折线
         ax2 = self.fig_ov_new.figure.subplots()
@@ -4682,9 +5094,10 @@ class StatsDialog(QtWidgets.QDialog):
             ax2.set_ylabel("新增")
         ax2.set_title("最近新增（近60天）")
         self._apply_axis_cjk(ax2, fp)
-        self.fig_ov_new.draw()
+        self.fig_ov_new.draw_idle()
 
     def _plot_activity(self):
+        fp = self._cjk_fp
         # 每日复习量
         ax = self.fig_act_cnt.figure.subplots()
         ax.clear()
@@ -4697,7 +5110,7 @@ class StatsDialog(QtWidgets.QDialog):
             ax.set_ylabel("复习次数")
         ax.set_title("每日复习量（近90天）")
         self._apply_axis_cjk(ax, fp)
-        self.fig_act_cnt.draw()
+        self.fig_act_cnt.draw_idle()
 
         # 每日正确率
         ax2 = self.fig_act_acc.figure.subplots()
@@ -4714,9 +5127,10 @@ class StatsDialog(QtWidgets.QDialog):
             ax2.set_ylabel("正确率%")
         ax2.set_title("每日正确率（近90天）")
         self._apply_axis_cjk(ax2, fp)
-        self.fig_act_acc.draw()
+        self.fig_act_acc.draw_idle()
 
     def _plot_quality(self):
+        fp = self._cjk_fp
         # EF 直方图
         ax = self.fig_ef.figure.subplots()
         ax.clear()
@@ -4729,7 +5143,7 @@ class StatsDialog(QtWidgets.QDialog):
         ax.set_title("EF（易度）分布")
         self._apply_axis_cjk(ax, fp)
 
-        self.fig_ef.draw()
+        self.fig_ef.draw_idle()
 
         # 重复次数直方图
         ax2 = self.fig_rep.figure.subplots()
@@ -4742,57 +5156,126 @@ class StatsDialog(QtWidgets.QDialog):
             self._apply_axis_cjk(ax2, fp)
         ax2.set_title("重复次数分布")
         self._apply_axis_cjk(ax2, fp)
-        self.fig_rep.draw()
+        self.fig_rep.draw_idle()
+
+    @staticmethod
+    def _bulk_fill(tbl, rows):
+        """
+        整表填充：rows 为若干行字符串。填充期间关掉重绘/排序/信号，
+        避免每个 setItem 都触发一次视图刷新；结束后恢复原状态。
+        """
+        sorting = tbl.isSortingEnabled()
+        tbl.setUpdatesEnabled(False)
+        tbl.setSortingEnabled(False)
+        blocker = QtCore.QSignalBlocker(tbl)
+        try:
+            tbl.setRowCount(len(rows))
+            for i, r in enumerate(rows):
+                for j, v in enumerate(r):
+                    tbl.setItem(i, j, QtWidgets.QTableWidgetItem(v))
+        finally:
+            blocker.unblock()
+            tbl.setSortingEnabled(sorting)
+            tbl.setUpdatesEnabled(True)
 
     def _fill_tables(self):
         # 单元 Top10
         if hasattr(self, "tbl_units"):
-            self.tbl_units.setRowCount(len(self.per_unit))
-            for i, (u, c) in enumerate(self.per_unit):
-                self.tbl_units.setItem(i, 0, QtWidgets.QTableWidgetItem(u or "(未分组)"))
-                self.tbl_units.setItem(i, 1, QtWidgets.QTableWidgetItem(str(int(c))))
+            self._bulk_fill(self.tbl_units,
+                            [(u or "(未分组)", str(int(c))) for u, c in self.per_unit])
         # 新增（近60天）
         if hasattr(self, "tbl_new"):
-            self.tbl_new.setRowCount(len(self.new_per_day))
-            for i, (d, n) in enumerate(self.new_per_day):
-                self.tbl_new.setItem(i, 0, QtWidgets.QTableWidgetItem(d))
-                self.tbl_new.setItem(i, 1, QtWidgets.QTableWidgetItem(str(int(n))))
+            self._bulk_fill(self.tbl_new,
+                            [(d, str(int(n))) for d, n in self.new_per_day])
         # 活动（近90天）
         if hasattr(self, "tbl_act"):
-            self.tbl_act.setRowCount(len(self.reviews_per_day))
-            for i, (d, n, c) in enumerate(self.reviews_per_day):
+            rows = []
+            for d, n, c in self.reviews_per_day:
                 acc = (100.0 * int(c) / int(n) if int(n) else 0.0)
-                self.tbl_act.setItem(i, 0, QtWidgets.QTableWidgetItem(d))
-                self.tbl_act.setItem(i, 1, QtWidgets.QTableWidgetItem(str(int(n))))
-                self.tbl_act.setItem(i, 2, QtWidgets.QTableWidgetItem(f"{acc:.1f}"))
+                rows.append((d, str(int(n)), f"{acc:.1f}"))
+            self._bulk_fill(self.tbl_act, rows)
         # EF & rep 分布（简表）
         if hasattr(self, "tbl_ef") and self.ef_list:
-            # 简单以 0.2 为步长
+            # 简单以 0.2 为步长；边界按“十分位整数”计算，避免 x += 0.2 的浮点累积误差
             import math
-            lo, hi = math.floor(min(self.ef_list) * 10) / 10.0, math.ceil(max(self.ef_list) * 10) / 10.0
-            bins = []
-            x = lo
-            while x < hi + 1e-9:
-                bins.append((x, x + 0.2))
-                x += 0.2
-            counts = [0] * len(bins)
+            lo10 = math.floor(min(self.ef_list) * 10)
+            hi10 = math.ceil(max(self.ef_list) * 10)
+            n = (hi10 - lo10) // 2 + 1
+            bins = [((lo10 + 2 * i) / 10.0, (lo10 + 2 * i + 2) / 10.0) for i in range(n)]
+            # 等宽分箱：下标直接算出来，不再对每个值逐个区间比较（O(N) 而非 O(N·K)）
+            counts = [0] * n
             for v in self.ef_list:
-                for i, (a, b) in enumerate(bins):
-                    if (v >= a and (v < b or (i == len(bins) - 1 and v <= b))):
-                        counts[i] += 1;
-                        break
-            self.tbl_ef.setRowCount(len(bins))
-            for i, (a, b) in enumerate(bins):
-                self.tbl_ef.setItem(i, 0, QtWidgets.QTableWidgetItem(f"{a:.1f}–{b:.1f}"))
-                self.tbl_ef.setItem(i, 1, QtWidgets.QTableWidgetItem(str(counts[i])))
+                i = int((v * 10 - lo10 + 1e-9) // 2)
+                counts[min(max(i, 0), n - 1)] += 1
+            self._bulk_fill(self.tbl_ef,
+                            [(f"{a:.1f}–{b:.1f}", str(counts[i])) for i, (a, b) in enumerate(bins)])
         if hasattr(self, "tbl_rep") and self.rep_list:
             from collections import Counter
             cc = Counter(self.rep_list)
             ks = sorted(cc.keys())
-            self.tbl_rep.setRowCount(len(ks))
-            for i, k in enumerate(ks):
-                self.tbl_rep.setItem(i, 0, QtWidgets.QTableWidgetItem(str(int(k))))
-                self.tbl_rep.setItem(i, 1, QtWidgets.QTableWidgetItem(str(int(cc[k]))))
+            self._bulk_fill(self.tbl_rep, [(str(int(k)), str(int(cc[k]))) for k in ks])
+
+
+class UnitOverviewModel(QtCore.QAbstractTableModel):
+    """
+    单元总览的只读模型：构造时按列预先算好文本（含罗马音），data() 按行号直接取。
+    视图只为可见行取数据，不再为每个单元格创建 QTableWidgetItem。
+    """
+    COLS = ["序号", "假名", "汉字写法", "罗马音", "释义", "重复次数"]
+
+    def __init__(self, rows: list, parent=None):
+        super().__init__(parent)
+        s = CardTableModel._s
+        # 约定索引：0:id, 3:term(假名), 4:释义, 11:jp_kanji, 12:jp_kana(罗马音源), 8:repetition
+        self._cols = [
+            [str(i + 1) for i in range(len(rows))],
+            [s(r, 3) for r in rows],
+            [s(r, 11) for r in rows],
+            [self._romaji(s(r, 12)) for r in rows],
+            [s(r, 4) for r in rows],
+            [self._rep(r) for r in rows],
+        ]
+        self._n = len(rows)
+
+    @staticmethod
+    def _romaji(jp_kana: str) -> str:
+        # 罗马音（由 jp_kana 转换；你的工程里 jp_kana 存罗马音源）
+        try:
+            return _romaji_cached(jp_kana) if jp_kana else ""
+        except Exception:
+            return ""
+
+    @staticmethod
+    def _rep(r) -> str:
+        try:
+            return str(int(r[8] or 0)) if len(r) > 8 else "0"
+        except Exception:
+            return "0"
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else self._n
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLS)
+
+    def headerData(self, section, orientation, role):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return self.COLS[section]
+        return super().headerData(section, orientation, role)  # 行号表头沿用默认的 1..N
+
+    def data(self, index, role):
+        if not index.isValid():
+            return None
+        if role == QtCore.Qt.DisplayRole:
+            return self._cols[index.column()][index.row()]
+        if role == QtCore.Qt.TextAlignmentRole and index.column() in (0, 5):
+            return QtCore.Qt.AlignCenter
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return QtCore.Qt.NoItemFlags
+        return QtCore.Qt.ItemIsSelectable | QtCore.Qt.ItemIsEnabled
 
 
 class UnitOverviewDialog(QtWidgets.QDialog):
@@ -4807,62 +5290,24 @@ class UnitOverviewDialog(QtWidgets.QDialog):
         tip.setObjectName("muted")
         layout.addWidget(tip)
 
-        table = QtWidgets.QTableWidget(self)
-        table.setColumnCount(6)
-        table.setHorizontalHeaderLabels(["序号", "假名", "汉字写法", "罗马音", "释义", "重复次数"])
+        table = QtWidgets.QTableView(self)
+        table.setUpdatesEnabled(False)
+        table.setSortingEnabled(False)
+        table.setModel(UnitOverviewModel(rows, table))
         header = table.horizontalHeader()
-        header.setSectionResizeMode(0, QtWidgets.QHeaderView.ResizeToContents)
         header.setSectionResizeMode(1, QtWidgets.QHeaderView.Stretch)
-        header.setSectionResizeMode(2, QtWidgets.QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(3, QtWidgets.QHeaderView.ResizeToContents)
         header.setSectionResizeMode(4, QtWidgets.QHeaderView.Stretch)
-        header.setSectionResizeMode(5, QtWidgets.QHeaderView.ResizeToContents)
-
-        table.setEditTriggers(QtWidgets.QTableWidget.NoEditTriggers)
-        table.setSelectionBehavior(QtWidgets.QTableWidget.SelectRows)
+        # 窄列只按内容量一次宽度：ResizeToContents 模式会在每次布局变化时重新扫描行来算列宽，
+        # 而这里数据是静态的，算一次后固定为可手动拖动即可
+        for c in (0, 2, 3, 5):
+            header.setSectionResizeMode(c, QtWidgets.QHeaderView.Interactive)
+            table.resizeColumnToContents(c)
+        table.setUpdatesEnabled(True)
+
+        table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
         table.setAlternatingRowColors(True)
 
-        table.setRowCount(len(rows))
-        # 约定索引：0:id, 3:term(假名), 4:释义, 11:jp_kanji, 12:jp_kana(罗马音源), 8:repetition
-        for i, r in enumerate(rows):
-            # 1) 序号列（1..N）
-            seq = QtWidgets.QTableWidgetItem(str(i + 1))
-            seq.setTextAlignment(QtCore.Qt.AlignCenter)
-            # 禁止编辑（可选）
-            seq.setFlags(seq.flags() & ~QtCore.Qt.ItemIsEditable)
-            table.setItem(i, 0, seq)
-
-            # 2) 假名
-            term_kana = (r[3] or "").strip() if len(r) > 3 and r[3] else ""
-            table.setItem(i, 1, QtWidgets.QTableWidgetItem(term_kana))
-
-            # 3) 汉字写法
-            jp_kanji = (r[11] or "").strip() if len(r) > 11 and r[11] else ""
-            table.setItem(i, 2, QtWidgets.QTableWidgetItem(jp_kanji))
-
-            # 4) 罗马音（由 jp_kana 转换；你的工程里 jp_kana 存罗马音源）
-            jp_kana = (r[12] or "").strip() if len(r) > 12 and r[12] else ""
-            try:
-                romaji = kana_to_romaji(jp_kana) if jp_kana else ""
-            except Exception:
-                romaji = ""
-            table.setItem(i, 3, QtWidgets.QTableWidgetItem(romaji))
-
-            # 5) 释义
-            mean = (r[4] or "").strip() if len(r) > 4 and r[4] else ""
-            table.setItem(i, 4, QtWidgets.QTableWidgetItem(mean))
-
-            # 6) 重复次数（居中）
-            rep = ""
-            try:
-                rep = str(int(r[8] or 0)) if len(r) > 8 else "0"
-            except Exception:
-                rep = "0"
-            rep_item = QtWidgets.QTableWidgetItem(rep)
-            rep_item.setTextAlignment(QtCore.Qt.AlignCenter)
-            rep_item.setFlags(rep_item.flags() & ~QtCore.Qt.ItemIsEditable)
-            table.setItem(i, 5, rep_item)
-
         layout.addWidget(table)
 
         btns = QtWidgets.QHBoxLayout()
@@ -4896,11 +5341,14 @@ class EditDialog(QtWidgets.QDialog):
         self.cb_unit.setEditable(False)
         units = list_units(conn)
         self.cb_unit.addItem("")  # 允许空单元
-        for u in units:
-            self.cb_unit.addItem(u)
+        self.cb_unit.addItems(units)
+        # 已有单元名集合：判重用集合查找，不在下拉模型里逐项 findText
+        self._unit_set = set(units)
+        self._unit_set.add("")
         cur_unit = (row[2] or "").strip()
-        if self.cb_unit.findText(cur_unit) < 0 and cur_unit:
+        if cur_unit and cur_unit not in self._unit_set:
             self.cb_unit.addItem(cur_unit)
+            self._unit_set.add(cur_unit)
         self.cb_unit.setCurrentText(cur_unit)
 
         # 新建单元按钮
@@ -4946,8 +5394,9 @@ class EditDialog(QtWidgets.QDialog):
         text, ok = QtWidgets.QInputDialog.getText(self, "新建单元", "单元名：")
         name = (text or "").strip()
         if ok and name:
-            if self.cb_unit.findText(name) < 0:
+            if name not in self._unit_set:
                 self.cb_unit.addItem(name)
+                self._unit_set.add(name)
             self.cb_unit.setCurrentText(name)
 
     def _on_save(self):
@@ -4975,6 +5424,8 @@ class EditDialog(QtWidgets.QDialog):
 
 
 class StudyWindow(QtWidgets.QWidget):
+    closed = QtCore.pyqtSignal()  # 窗口关闭（复习记录已写入），主窗口据此刷新缓存
+
     def __init__(self, db, unit_filter=None, include_all=False):
         super().__init__()
         self.db = db
@@ -5077,6 +5528,17 @@ class StudyWindow(QtWidgets.QWidget):
 
         # 内部状态
         self.queue = []
+        self._card_cache = {}  # card_id -> 该卡各类 HTML（见 _card_html）
+        self._pending_reviews = []  # 待写入的 reviews 事件（见 _record_review / _flush_reviews）
+        # 缓冲最多停留 _REVIEW_FLUSH_MS：卡片的 SRS 状态是即时写的，日志不能长时间落后
+        self._review_timer = QtCore.QTimer(self); self._review_timer.setSingleShot(True)
+        self._review_timer.setInterval(self._REVIEW_FLUSH_MS)
+        self._review_timer.timeout.connect(self._flush_reviews)
+        app = QtWidgets.QApplication.instance()
+        if app:
+            app.aboutToQuit.connect(self._flush_reviews)
+        self._mean_text = ""  # mean_label 当前文本（见 _set_mean_text）
+        self._answer_sets = {}  # card_id -> 可接受答案集合（见 _answer_set）
         self.idx = 0
         self.current = None
         self.session_total = 0
@@ -5085,16 +5547,8 @@ class StudyWindow(QtWidgets.QWidget):
         self._rated = False
         self._ts_start = 0.0
 
-        # === 修复：初始化 TTS 引擎 (必须加在这里) ===
-        self.speech = QtTextToSpeech.QTextToSpeech()
-        found_ja = False
-        for locale in self.speech.availableLocales():
-            if locale.name().startswith("ja"):
-                self.speech.setLocale(locale)
-                found_ja = True
-                break
-        if not found_ja:
-            print("[StudyWindow] Warning: No Japanese TTS voice found. Using default.")
+        # === 修复：初始化 TTS 引擎 (必须加在这里；与主窗口共用，见 _get_tts) ===
+        self.speech = _get_tts()
 
         # 准备复习队列 (保持在最后)
         self.prepare_queue()
@@ -5114,21 +5568,44 @@ class StudyWindow(QtWidgets.QWidget):
         p = self.parent()
         return getattr(p, "db", None) if p else None
 
+    # 攒够这么多条 reviews 事件再落库
+    _REVIEW_FLUSH_EVERY = 10
+    _REVIEW_FLUSH_MS = 2000
+
     def _record_review(self, quality: int, elapsed_ms: Optional[int] = None):
-        """写 reviews 事件（失败不抛错，保证复习流程不断）"""
+        """记一条 reviews 事件（时间戳取作答时刻）；先进缓冲，由 _flush_reviews 批量写入"""
         try:
-            conn = self._get_conn()
-            if not conn or not self.current:
+            if not self.current:
                 return
             row, mode = self.current
-            card_id = int(row[0]) if row and row[0] is not None else None
+            card_id = int(row.id) if row and row.id is not None else None
             if not card_id:
                 return
-            insert_review(conn, card_id, int(mode), int(quality), elapsed_ms)
+            self._pending_reviews.append((card_id, _now_iso(), int(mode), int(quality), elapsed_ms))
+            if not self._review_timer.isActive():
+                self._review_timer.start()
         except Exception:
             # 不阻断主流程
             pass
 
+    def _flush_reviews(self):
+        """把缓冲的 reviews 一次写入（失败不抛错，保证复习流程不断；写入成功才清缓冲，失败留待下次重试）"""
+        self._review_timer.stop()
+        if not self._pending_reviews:
+            return
+        conn = None
+        try:
+            conn = self._get_conn()
+            if conn:
+                insert_reviews(conn, self._pending_reviews)
+                self._pending_reviews = []
+        except Exception:
+            # 回滚已插入的部分行，下次重试时不会重复写入
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+
     def submit_rating(self, quality: int):
         # 防重复评分
         if self._rated:
@@ -5163,21 +5640,18 @@ class StudyWindow(QtWidgets.QWidget):
         if unit in ("所有单元", "", None):
             unit = None
 
-        # 调试打印，便于核对传入条件和数据量
-        try:
-            cur = self.db.cursor()
-            total = cur.execute('SELECT COUNT(*) FROM cards').fetchone()[0]
-            print(f"[Study] unit={unit!r}, include_all={getattr(self, 'include_all', False)}, total_cards={total}")
-        except Exception:
-            pass
+        # 调试打印，便于核对传入条件和数据量；COUNT(*) 要扫全表，只在设置 NVT_DEBUG 时执行
+        if os.environ.get("NVT_DEBUG"):
+            try:
+                cur = self.db.cursor()
+                total = cur.execute('SELECT COUNT(*) FROM cards').fetchone()[0]
+                print(f"[Study] unit={unit!r}, include_all={getattr(self, 'include_all', False)}, total_cards={total}")
+            except Exception:
+                pass
 
-        # 1) 优先按“不过滤到期”或“无到期时回退到全部”
-        if getattr(self, 'include_all', False):
-            rows = list_cards_by_unit(self.db, unit=unit)
-        else:
-            rows = list_due_cards(self.db, unit=unit)
-            if not rows:  # 无到期则回退到“全部”
-                rows = list_cards_by_unit(self.db, unit=unit)
+        # 1) 取本单元的卡片。list_due_cards 现已不按到期筛选（与 list_cards_by_unit 等价），
+        #    原先“到期为空再取全部”的回退只会把同一条查询再跑一遍，这里只查一次
+        rows = list_cards_by_unit(self.db, unit=unit)
 
         # 额外兜底：若是按某单元取不到，退回所有单元
         if not rows and unit is not None:
@@ -5192,13 +5666,15 @@ class StudyWindow(QtWidgets.QWidget):
             return
 
         # 3) 组卷：日→中 70% / 中→日 30%
-        num_mode0 = int(n * 1.0)  # 模式0：日→中
+        num_mode0 = int(round(n * 0.7))  # 模式0：日→中
         num_mode1 = n - num_mode0  # 模式1：中→日
         modes = [0] * num_mode0 + [1] * num_mode1
-        random.shuffle(modes)
+        if num_mode1:  # 全是同一模式时打乱没有意义
+            random.shuffle(modes)
 
-        for r, m in zip(rows, modes):
-            self.queue.append((r, m))
+        self.queue = list(zip(map(to_card, rows), modes))
+        self._card_cache = {}  # 新队列的行可能已被编辑过，旧缓存作废
+        self._answer_sets = {}
 
         # 4) 开始第一题
         self.idx = 0
@@ -5263,12 +5739,13 @@ class StudyWindow(QtWidgets.QWidget):
         self.showing_mean = False
 
         # 清理释义 & 禁用继续
-        self.mean_label.clear()
+        # 日→中 的释义在这里就写好（隐藏着），之后空格展开/收起只切换可见性
         self.mean_label.hide()
+        self._set_mean_text((row.meaning or "").strip() if mode == 0 else "")
         self.continue_btn.setEnabled(False)
 
         # 停止上一次发音
-        self.speech.stop()
+        _tts_stop()
 
         # 评分按钮：日→中可见但初始禁用
         if self.current and self.current[1] == 0:
@@ -5301,82 +5778,114 @@ class StudyWindow(QtWidgets.QWidget):
         # 展示题面
         if mode == 0:
             # === 模式 0: 日语 -> 中文 ===
-            kana = pick_kana(row)
-            kanji = get_jp_kanji(row)
-            romaji = pick_romaji(row, kana)
+            c = self._card_html(row)
 
             # === 新增：自动朗读假名 ===
-            kana_text = kana or (row[3] or "").strip()
-            if kana_text:
-                self.speech.say(kana_text)
+            _tts_say(c["speak"])
 
-            big_css = "font-size:48px; font-weight:bold; line-height:1.2;"
-            small_css = "font-size:18px; color:#6b7280; line-height:1.2;"
-            parts = []
-            if romaji:
-                parts.append(f"<div style='{small_css}'>{html.escape(romaji)}</div>")
-            if kana:
-                parts.append(f"<div style='{big_css}'>{html.escape(kana)}</div>")
-            if kanji:
-                parts.append(f"<div style='{small_css}'>{html.escape(kanji)}</div>")
-            if not parts:
-                term = (row[3] or "").strip()
-                parts.append(f"<div style='{big_css}'>{html.escape(term) if term else '——'}</div>")
-            self.term_label.setText("<div style='text-align:center'>" + "".join(parts) + "</div>")
+            self.term_label.setText(c["front_jp"])
             self.term_label.show()
         else:
             # === 模式 1: 中文 -> 日语 ===
-            zh = (row[4] or "").strip()
-            self.term_label.setText(
-                f"<div style='text-align:center; font-size:32px; font-weight:bold'>{html.escape(zh) if zh else '——'}</div>")
+            self.term_label.setText(self._card_html(row)["front_zh"])
             self.term_label.show()
 
-    def _show_jp_answer_block(self, row, correct: bool):
-        # 统一答案展示块（含对错提示）
+    def _card_html(self, row) -> dict:
+        """
+        按 card_id 缓存一张卡的全部展示 HTML：题面（日/中）、答对/答错块、中性答案块。
+        pick_kana / pick_romaji / html.escape 每张卡只算一次，回看或再次出现时直接取。
+        """
+        cid = row.id
+        hit = self._card_cache.get(cid)
+        if hit is not None:
+            return hit
+
         kana = pick_kana(row)
         kanji = get_jp_kanji(row)
-        if not kana and not kanji:
-            # 回退 term
-            term = (row[3] or "").strip()
-            kana = term if term else ""
+        term = (row.term or "").strip()
+        zh = (row.meaning or "").strip()
         romaji = pick_romaji(row, kana)
-        big_css = "font-size:28px; font-weight:800; line-height:1.2; font-family:'Zen Maru Gothic','Noto Sans CJK JP';"
-        small_css = "font-size:16px; color:#6b7280; line-height:1.2; font-family:'Zen Maru Gothic','Noto Sans CJK JP';"
-        state_css = "color:#059669;" if correct else "color:#b91c1c;"
-        state_txt = "✔ 正确" if correct else "✘ 错误"
-        answer_parts = [f"<div style='{state_css}'>{state_txt}</div>"]
+        # 答案块：假名与汉字都没有时回退 term
+        a_kana = kana if (kana or kanji) else term
+        a_romaji = romaji if a_kana == kana else pick_romaji(row, a_kana)
+
+        # 各字段只转义一次，下面所有 HTML 变体共用
+        esc = html.escape
+        e_kana = esc(kana) if kana else ""
+        e_kanji = esc(kanji) if kanji else ""
+        e_term = esc(term) if term else ""
+        e_zh = esc(zh) if zh else ""
+        e_romaji = esc(romaji) if romaji else ""
+        e_a_kana = e_kana if a_kana == kana else e_term
+        e_a_romaji = e_romaji if a_romaji == romaji else esc(a_romaji)
+
+        # 题面（模式 0）：不做 term 回退的假名/罗马音
+        big_css = "font-size:48px; font-weight:bold; line-height:1.2;"
+        small_css = "font-size:18px; color:#6b7280; line-height:1.2;"
+        parts = []
         if romaji:
-            answer_parts.append(f"<div style='{small_css}'>{html.escape(romaji)}</div>")
+            parts.append(f"<div style='{small_css}'>{e_romaji}</div>")
         if kana:
-            answer_parts.append(f"<div style='{big_css}'>{html.escape(kana)}</div>")
+            parts.append(f"<div style='{big_css}'>{e_kana}</div>")
         if kanji:
-            answer_parts.append(f"<div style='{small_css}'>{html.escape(kanji)}</div>")
-        zh = (row[4] or "").strip()
-        tip = "<div style='text-align:center'>" + "".join(answer_parts) + (
-            f"<div style='{small_css}'>{html.escape(zh)}</div>" if zh else "") + "</div>"
-        return tip
+            parts.append(f"<div style='{small_css}'>{e_kanji}</div>")
+        if not parts:
+            parts.append(f"<div style='{big_css}'>{e_term or '——'}</div>")
+        front_jp = "<div style='text-align:center'>" + "".join(parts) + "</div>"
+
+        font = "font-family:'Zen Maru Gothic','Noto Sans CJK JP';"
+        small_css = f"font-size:16px; color:#6b7280; line-height:1.2; {font}"
+
+        def body(weight):
+            big = f"font-size:28px; font-weight:{weight}; line-height:1.2; {font}"
+            out = []
+            if a_romaji:
+                out.append(f"<div style='{small_css}'>{e_a_romaji}</div>")
+            if a_kana:
+                out.append(f"<div style='{big}'>{e_a_kana}</div>")
+            if kanji:
+                out.append(f"<div style='{small_css}'>{e_kanji}</div>")
+            if zh:
+                out.append(f"<div style='{small_css}'>{e_zh}</div>")
+            return "".join(out)
+
+        bold = body("800")
+        c = {
+            "speak": kana or term,
+            "front_jp": front_jp,
+            "front_zh": f"<div style='text-align:center; font-size:32px; font-weight:bold'>{e_zh or '——'}</div>",
+            "answer_ok": "<div style='text-align:center'><div style='color:#059669;'>✔ 正确</div>" + bold + "</div>",
+            "answer_bad": "<div style='text-align:center'><div style='color:#b91c1c;'>✘ 错误</div>" + bold + "</div>",
+            "neutral": "<div style='text-align:center'>" + body("normal") + "</div>",
+        }
+        self._card_cache[cid] = c
+        return c
+
+    def _set_mean_text(self, text: str):
+        """mean_label 内容没变就不 setText（setText 会让 QLabel 重新排版富文本）。"""
+        if text != self._mean_text:
+            self.mean_label.setText(text)
+            self._mean_text = text
+
+    def _answer_set(self, row) -> frozenset:
+        """中→日 模式的可接受答案（假名/汉字/含假名或汉字的 term），按 card_id 缓存。"""
+        cid = row.id
+        answers = self._answer_sets.get(cid)
+        if answers is None:
+            answers = {norm(x) for x in (pick_kana(row), get_jp_kanji(row)) if x}
+            term = norm(row.term)
+            if term and (_has_kana(term) or _has_kanji(term)):
+                answers.add(term)
+            answers = self._answer_sets[cid] = frozenset(answers)
+        return answers
+
+    def _show_jp_answer_block(self, row, correct: bool):
+        # 统一答案展示块（含对错提示）
+        return self._card_html(row)["answer_ok" if correct else "answer_bad"]
 
     def _build_jp_neutral_block(self, row):
         # 仅展示 romaji/kana/kanji 与中文释义，不显示“正确/错误”提示
-        kana = pick_kana(row)
-        kanji = get_jp_kanji(row)
-        if not kana and not kanji:
-            term = (row[3] or "").strip()
-            kana = term if term else ""
-        romaji = pick_romaji(row, kana)
-        big_css = "font-size:28px; font-weight:normal; line-height:1.2; font-family:'Zen Maru Gothic','Noto Sans CJK JP';"
-        small_css = "font-size:16px; color:#6b7280; line-height:1.2; font-family:'Zen Maru Gothic','Noto Sans CJK JP';"
-        parts = []
-        if romaji:
-            parts.append(f"<div style='{small_css}'>{html.escape(romaji)}</div>")
-        if kana:
-            parts.append(f"<div style='{big_css}'>{html.escape(kana)}</div>")
-        if kanji:
-            parts.append(f"<div style='{small_css}'>{html.escape(kanji)}</div>")
-        zh = (row[4] or "").strip()
-        if zh:
-            parts.append(f"<div style='{small_css}'>{html.escape(zh)}</div>")
-        return "<div style='text-align:center'>" + "".join(parts) + "</div>"
+        return self._card_html(row)["neutral"]
 
     def check_answer(self):
         if not self.current:
@@ -5386,22 +5895,11 @@ class StudyWindow(QtWidgets.QWidget):
             return
 
         user_input = norm(self.input_answer.text())
-        answers = set()
-        kana = pick_kana(row)
-        kanji = get_jp_kanji(row)
-        if kana: answers.add(norm(kana))
-        if kanji: answers.add(norm(kanji))
-        term = norm(row[3])
-        if term and (_has_kana(term) or _has_kanji(term)):
-            answers.add(term)
-
-        correct = bool(user_input) and (norm(user_input) in answers)
+        correct = bool(user_input) and (user_input in self._answer_set(row))
 
         # === 新增：无论对错，只要展示了答案，就朗读正确的假名 ===
-        kana_text = kana or term or ""
-        if kana_text:
-            self.speech.stop()
-            self.speech.say(kana_text)
+        kana_text = self._card_html(row)["speak"]
+        _tts_say(kana_text)
 
         # 只在首次判定时计数 & 正确数
         if not self._rated:
@@ -5425,26 +5923,26 @@ class StudyWindow(QtWidgets.QWidget):
         if (not correct) and _has_kanji(user_input):
             std_kana = norm(pick_kana(row) or "")
             if not std_kana:
-                t = (row[3] or "").strip()
+                t = (row.term or "").strip()
                 std_kana = norm(t) if t and _has_kana(t) else ""
             if std_kana:
                 try:
-                    rec = _LOCAL_DICT.get_full(user_input)
+                    rec = _suggest_full_cached(user_input)  # 与输入联想共用同一份词典查询缓存
                     if rec and norm(rec[1]) == std_kana:
                         correct = True
                 except Exception:
                     pass
 
         # 展示答案
-        self.mean_label.setText(self._show_jp_answer_block(row, correct))
+        self._set_mean_text(self._show_jp_answer_block(row, correct))
         self.mean_label.show()
         self.showing_mean = True
 
         # 更新记忆算法
         q = 4 if correct else 1
         interval, repetition, ef = sm2_update(row, q)
-        last_review = datetime.now().astimezone().isoformat(timespec="seconds")
-        update_card_review(self.db, row[0], interval, repetition, ef, last_review, None)
+        last_review = _now_iso()
+        update_card_review(self.db, row.id, interval, repetition, ef, last_review, None)
 
         if self.answer_box:
             self.input_answer.setEnabled(False)
@@ -5459,14 +5957,14 @@ class StudyWindow(QtWidgets.QWidget):
             return
 
         # 无需输入，直接按错误处理并展示答案
-        self.mean_label.setText(self._show_jp_answer_block(row, correct=False))
+        self._set_mean_text(self._show_jp_answer_block(row, correct=False))
         self.mean_label.show()
         self.showing_mean = True
 
         # 更新记忆算法与计数（质量=1）
         interval, repetition, ef = sm2_update(row, 1)
-        last_review = datetime.utcnow().isoformat()
-        update_card_review(self.db, row[0], interval, repetition, ef, last_review, None)
+        last_review = _now_iso()  # 与其它写入一致用本地时间（原先这里写的是不带时区的 UTC）
+        update_card_review(self.db, row.id, interval, repetition, ef, last_review, None)
         self.session_total += 1
         self.info_label.setText(f"已做 {self.session_total}，正确 {self.session_correct}")
 
@@ -5518,15 +6016,13 @@ class StudyWindow(QtWidgets.QWidget):
 
         # 隐藏 -> 展开
         if mode == 0:
-            # 日→中：展开显示中文释义；启用评分；继续按钮仍禁用（等待评分）
-            zh = (row[4] or "").strip()
-            self.mean_label.setText(zh)
+            # 日→中：展开显示中文释义（文本已在 show_card 写好）；启用评分；继续按钮仍禁用（等待评分）
             for b in (self.btn_again, self.btn_hard, self.btn_good, self.btn_easy):
                 b.setEnabled(not self._rated)
             self.continue_btn.setEnabled(False)
         else:
             # 中→日：展开显示“中立答案块”（不显示对/错，不计分）
-            self.mean_label.setText(self._build_jp_neutral_block(row))
+            self._set_mean_text(self._build_jp_neutral_block(row))
             self.continue_btn.setEnabled(True)
             if self.answer_box:
                 self.input_answer.setEnabled(False)
@@ -5549,6 +6045,8 @@ class StudyWindow(QtWidgets.QWidget):
         if self.current and self.current[1] == 0:
             for b in (self.btn_again, self.btn_hard, self.btn_good, self.btn_easy):
                 b.setEnabled(False)
+        if len(self._pending_reviews) >= self._REVIEW_FLUSH_EVERY:
+            self._flush_reviews()
         self.idx += 1
         if self.idx >= len(self.queue):
             QtWidgets.QMessageBox.information(self, "完成", "本轮复习完成。")
@@ -5564,6 +6062,11 @@ class StudyWindow(QtWidgets.QWidget):
         # 未判定/未评分：先展开释义
         self.toggle_meaning()
 
+    def closeEvent(self, e: QtGui.QCloseEvent):
+        self._flush_reviews()
+        self.closed.emit()
+        super().closeEvent(e)
+
 def main():
     app = QtWidgets.QApplication(sys.argv)
 